@@ -10,6 +10,7 @@ from serpent import (
 	io,
 	math,
 	padding,
+	parallel,
 	visual,
 )
 
@@ -21,5 +22,6 @@ __all__= [
 	'io',
 	'math',
 	'padding',
+	'parallel',
 	'visual',
 ]
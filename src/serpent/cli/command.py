@@ -5,9 +5,9 @@
 from __future__ import annotations
 
 import fileinput
-import itertools as itr
 import sys
 from collections import Counter
+from functools import partial
 from pathlib import Path
 
 import argh
@@ -25,6 +25,7 @@ from serpent.cli.pep import all_symbols_for, peptides_of_length
 from serpent.cli.pulse import (
 	pulse_plot_sequences,
 	pulse_text,
+	sequence_pulses,
 )
 from serpent.cli.quasar import dna_quasar_seq
 from serpent.cli.tide import plot_tides, tide_sequence, tide_total
@@ -33,10 +34,11 @@ from serpent.cli.zigzag import zigzag_blocks, zigzag_text
 from serpent.convert.amino import aa_tables, aminos_for_table
 from serpent.convert.dnt import is_degenerate
 from serpent.convert.split import split_aminos, split_encoded
-from serpent.fun import second, sort_values, str_join
+from serpent.fun import sort_values, str_join
 from serpent.io.fasta import (
 	ParseError,
 	auto_select_amino,
+	compile_regex,
 	descriptions_and_data,
 	find_fasta_files,
 	find_fasta_sequences,
@@ -65,7 +67,8 @@ from serpent.io.printing import (
 )
 from serpent.math.basic import autowidth_for
 from serpent.math.dsp import fft_spectra
-from serpent.math.statistic import ac_peaks, autocorrelogram, ewma, quasar_pulses
+from serpent.math.statistic import ac_peaks, autocorrelogram, count_groups, ewma
+from serpent.parallel import pmap
 from serpent.settings import (
 	BASE_ORDER,
 	COUNT_LIMIT,
@@ -155,7 +158,7 @@ def codons(filename, degen_only=False, width=20, stats=False, limit=COUNT_LIMIT)
 @arg('--amino', '-a', help='Amino acid input')
 @arg('--base',  '-b', help='Base information unit', type=float)
 @arg('--plot',  '-p', help='Plot data')
-@arg('--reg',   '-r', help='Filter sequences by regexp', type=str)
+@arg('--reg',   '-r', help='Filter sequences by regexp', type=compile_regex)
 @arg('--seql',  '-q', help='Sequence length', type=int)
 @arg('--step',  '-s', help='Step size', type=int)
 @aliases('ent')
@@ -183,11 +186,16 @@ def entropy(*inputs, base=2.0, amino=False, plot=False, reg=None, seql=None, ste
 					yield from descriptions
 					yield from format_entropy(data, base, seql, step)
 		else:
-			lines = readlines(filename)
+			lines = (
+				line for line in readlines(filename)
+				if not regex_no_match(reg, line)
+			)
+			if seql:
+				# Windows need the data in order instead of symbol counts
+				yield from format_entropy(str_join(lines), base, seql, step)
+				continue
 			counts = Counter()
 			for line in lines:
-				if regex_no_match(reg, line):
-					continue
 				counts.update(line)
 			yield from format_entropy(counts, base, seql, step)
 
@@ -246,14 +254,16 @@ def decode(filename, amino=False, degen=False, table=1):
 @arg('--table', '-t', help='Amino acid translation table', choices=aa_tables)
 @arg('--degen', '-g', help='Degenerate data')
 @arg('--fmt',   '-f', help='Output format', choices=fmt_choices)
+@arg('--jobs',  '-j', help='Parallel jobs (0 for physical cores)', type=int)
 @arg('--out',   '-o', help='Write out to file')
-@arg('--reg',   '-r', help='Filter sequences by regexp on descriptions', type=str)
+@arg('--reg',   '-r', help='Filter sequences by regexp on descriptions',
+	type=compile_regex)
 @arg('--width', '-w', help='Line width', type=int)
 @wrap_errors(wrapped_errors)
 def encode(
 	*inputs,
 	fmt='codon', out=False, width=64, reg=None,
-	amino=False, degen=False, table=1,
+	amino=False, degen=False, table=1, jobs=1,
 ):
 	"""Encode data into various formats."""
 	amino_opt = amino
@@ -266,7 +276,7 @@ def encode(
 
 		lines = encode_sequences(
 			seqs, width, fmt, reg=reg,
-			amino=amino, table=table, degen=degen)
+			amino=amino, table=table, degen=degen, jobs=jobs)
 
 		if out:
 			ext = file_extension_for(fmt)
@@ -358,7 +368,8 @@ def split(
 @arg('--desc',    '-c', help='Output descriptions')
 @arg('--fmt',     '-f', help='Output format', choices=fmt_choices)
 @arg('--mode',    '-m', help='Image mode', choices=('RGB', 'L', 'P'))
-@arg('--reg',     '-r', help='Filter sequences by regexp on descriptions', type=str)
+@arg('--reg',     '-r', help='Filter sequences by regexp on descriptions',
+	type=compile_regex)
 @arg('--verbose', '-v', help='Verbose mode')
 @arg('--width',   '-w', help='Line width', type=int)
 @wrap_errors(wrapped_errors)
@@ -397,6 +408,7 @@ def flow(
 @arg('--amino',  '-a', help='Amino acid input')
 @arg('--table',  '-t', help='Amino acid translation table', choices=aa_tables)
 @arg('--degen',  '-g', help='Degenerate data')
+@arg('--jobs',   '-j', help='Parallel jobs (0 for physical cores)', type=int)
 @arg('--mode',   '-m', help='Image mode', choices=('RGB', 'L', 'P', 'Q'))
 @arg('--out',    '-o', help='Write image to file')
 @arg('--seql',   '-q', help='Sequence length (for Q mode)', type=int)
@@ -405,7 +417,7 @@ def flow(
 def image(
 	filename,
 	seql=1, width=None, mode="RGB", out=False,
-	amino=False, degen=False, table=1,
+	amino=False, degen=False, table=1, jobs=1,
 ):
 	"""Visualise FASTA data as images."""
 	amino = auto_select_amino(filename, amino)
@@ -419,7 +431,7 @@ def image(
 
 	img = dna_image(
 		seqs, width, mode,
-		amino=amino, degen=degen, table=table, length=seql)
+		amino=amino, degen=degen, table=table, length=seql, jobs=jobs)
 
 	outfile = image_name_for(
 		filename, width, mode,
@@ -436,11 +448,12 @@ def image(
 @arg('--plot',  '-p', help='Plot data')
 @arg('--count', '-c', help='Print counts')
 @arg('--cumulative', '-m', help='Cumulative')
+@arg('--jobs',  '-j', help='Parallel jobs (0 for physical cores)', type=int)
 @wrap_errors(wrapped_errors)
 def pulse(
 	filename,
 	count=False, cumulative=False, plot=False,
-	amino=False, degen=False, table=1,
+	amino=False, degen=False, table=1, jobs=1,
 ):
 	"""Pulse repetition intervals for symbol repeat lengths (with plot option)."""
 	amino = auto_select_amino(filename, amino)
@@ -455,23 +468,16 @@ def pulse(
 		pulse_plot_sequences(
 			ax, seqs, key,
 			amino=amino, table=table, degen=degen,
-			count=count, cumulative=cumulative,
+			count=count, cumulative=cumulative, jobs=jobs,
 		)
 		interactive()
 		wait_user()
 	else:
-		for sequence in seqs:
-			[aminos, descriptions] = dna.decode_seq(
-				sequence,
-				amino, table, degen,
-				dna.to_amino
-			)
-			pulses, height, scale = quasar_pulses(
-				aminos,
-				cumulative=cumulative,
-				key=key
-			)
+		pulses_for = partial(
+			sequence_pulses, key=key,
+			amino=amino, table=table, degen=degen, cumulative=cumulative)
 
+		for pulses, height, scale, descriptions in pmap(pulses_for, seqs, jobs):
 			yield from descriptions
 			yield from pulse_text(pulses, height, scale)
 
@@ -708,7 +714,8 @@ def vectors(filename, split='', amino=False, table=1, degen=False):
 @arg('--step',    '-s', help='Step size (smoothing by overlap)', type=int)
 @arg('--test',    '-t', help='Test path quality (compare to blueprint)')
 @arg('--unit',    '-u', help='Stay on unit square')
-@arg('--reg',     '-r', help='Filter sequences by regexp on descriptions', type=str)
+@arg('--reg',     '-r', help='Filter sequences by regexp on descriptions',
+	type=compile_regex)
 @wrap_errors(wrapped_errors)
 def walk(
 	filename,
@@ -779,7 +786,7 @@ def pep(
 	else:
 		print("Peptides not appearing:\n")
 		combos = all_symbols_for(fmt, seql, table)
-		absent = combos[[combo not in peptides for combo in combos]]
+		absent = combos[~np.isin(combos, [*set(peptides)])]
 
 		yield from format_lines(absent, width)
 
@@ -806,17 +813,10 @@ def pepcount(
 	encoded = encode_data(data, fmt, amino, table, degen)
 
 	peptides = peptides_of_length(encoded, seql)
-	counts = Counter(peptides)
 
-	groups = itr.groupby(counts.most_common(), second)
-	grouped = (
-		(count, [peptide for peptide, _ in group])
-		for count, group in groups
-		if count >= limit
-	)
-	for count, values in grouped:
+	for count, values in count_groups(peptides, limit):
 		yield f"-- {count} times --"
-		yield from format_lines(sorted(values), width)
+		yield from format_lines(values.tolist(), width)
 
 
 def main():
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from functools import partial
+
 from serpent import dna
 from serpent.io.fasta import descriptions_and_data, regex_no_match
 from serpent.io.printing import reflow
+from serpent.parallel import pmap
 
 
 def encode_data(data, fmt, amino=False, table=1, degen=False):
@@ -20,19 +23,32 @@ def encode_data(data, fmt, amino=False, table=1, degen=False):
 
 
 # ruff: noqa: PLR0913 # Too many arguments in function definition
+def encode_sequence(
+	sequence, width, fmt,
+	*,
+	reg=None,
+	amino=False, table=1, degen=False
+) -> list[str]:
+	"""Encode a single sequence into description and reflowed data lines."""
+	[descriptions, data] = descriptions_and_data(sequence)
+	if regex_no_match(reg, descriptions):
+		return []
+
+	encoded = encode_data(data, fmt, amino, table, degen)
+
+	return [*descriptions, *reflow(encoded, width)]
+
+
 def encode_sequences(
 	seqs, width, fmt,
 	*,
 	reg=None,
-	amino=False, table=1, degen=False
+	amino=False, table=1, degen=False,
+	jobs=1,
 ):
-	for sequence in seqs:
-		[descriptions, data] = descriptions_and_data(sequence)
-		if regex_no_match(reg, descriptions):
-			continue
-
-		yield from descriptions
+	encode = partial(
+		encode_sequence, width=width, fmt=fmt, reg=reg,
+		amino=amino, table=table, degen=degen)
 
-		encoded = encode_data(data, fmt, amino, table, degen)
-		lines = reflow(encoded, width)
+	for lines in pmap(encode, seqs, jobs):
 		yield from lines
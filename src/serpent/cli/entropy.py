@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+from collections import Counter
+
 import matplotlib.pyplot as plt
-import more_itertools as mit
 import numpy as np
 
-from serpent.math.information import efficiency, statistics, statistics_header
+from serpent.math.basic import logn
+from serpent.math.information import (
+	format_statistics,
+	statistics,
+	statistics_header,
+	windowed_entropy,
+)
 
 
 def check_step_size(seql, step):
@@ -19,9 +26,14 @@ def check_step_size(seql, step):
 def format_entropy(data, base=2, seql=None, step=None):
 	yield statistics_header()
 	if seql:
+		if isinstance(data, Counter):
+			err_msg = 'Windowed statistics need the data in order, not symbol counts'
+			raise TypeError(err_msg)
 		step = check_step_size(seql, step)
-		for chunk in mit.windowed(data, seql, step=step):
-			yield statistics(chunk, base)
+		total = min(seql, len(data))
+		windows = windowed_entropy(data, seql, step, base)
+		for entr, cardinality in zip(*windows, strict=True):
+			yield format_statistics(entr, cardinality, total, base)
 	else:
 		yield statistics(data, base)
 
@@ -31,8 +43,7 @@ def plot_entropy(data, base=2, seql=None, step=None, color=None):
 		seql = 256
 
 	step = check_step_size(seql, step)
-	eff = np.array(
-		[efficiency(w, base) for w in mit.windowed(data, seql, step=step)],
-		dtype=np.float64
-	)
+	entr, cardinality = windowed_entropy(data, seql, step, base)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		eff = entr / logn(cardinality, base)
 	plt.plot(eff, color=color)
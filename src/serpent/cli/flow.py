@@ -30,10 +30,12 @@ def verbose_flow_blocks(
 	if not fmt:
 		fmt = 'amino' if amino else 'codon'
 
-	if fmt in ['a', 'amino']:
+	# Derive the text from the decoded data instead of cleaning the data again,
+	# except for amino and degenerate data that are padded differently
+	if fmt in ['a', 'amino'] and (amino or degen):
 		text = dna.to_amino(data, amino, table, degen)
-	elif fmt in ['c', 'codon']:
-		text = str_join(dna.encode(decoded, fmt=fmt, degen=degen))
+	elif fmt in ['a', 'amino', 'c', 'codon']:
+		text = str_join(dna.encode(decoded, fmt=fmt, degen=degen, table=table))
 	else:
 		err_msg = 'Unknown format'
 		raise NotImplementedError(err_msg)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections import deque
+from functools import partial
+
 import numpy as np
 from numpy.typing import NDArray
 from PIL import Image
@@ -7,43 +10,63 @@ from PIL import Image
 from serpent import dna
 from serpent.convert.quad import dna_to_quad, quads_to_rgb
 from serpent.io.fasta import descriptions_and_data
-from serpent.padding import pad_end
+from serpent.parallel import pmap
 from serpent.typing import CodonData
-from serpent.visual.bitmap import RGB_MAX, height_for, num_to_pixel
+from serpent.visual.bitmap import RGB_MAX, num_to_pixel
 from serpent.visual.palette import apply_palette
 
 
+def image_height(length: int, width: int, mode="RGB") -> int:
+	"""Return the image height for decoded data of length in width.
+
+	>>> image_height(12, 4), image_height(13, 4), image_height(13, 4, 'L')
+	(1, 2, 6)
+	"""
+	n = width if mode == 'P' else 3 * width
+	padded = -(-length // n) * n
+
+	return padded // (width * len(mode))
+
+
+def image_shape(height: int, width: int, mode="RGB") -> tuple[int, ...]:
+	"""Return the array shape for an image of height and width in mode."""
+	channels: int = len(mode)
+
+	return (height, width, channels) if channels > 1 else (height, width)
+
+
 # ruff: noqa: PLR0913
 def dna_image_data(
 	decoded: CodonData, width=64, fill=0, mode="RGB",
 	amino=False, degen=False,
+	out: NDArray[np.uint8] | None = None,
 ) -> NDArray[np.uint8]:
 	"""Convert decoded DNA data to full colour image.
 
 	The codons are mapped to 64 ** 3 (=262144) RGB colours quite directly,
 	so that: G: 1, A: 85, C: 169, T (or U): 253.
+
+	The pixels are written into out, when given, so that several images
+	can be stacked into one preallocated array.
 	"""
 	# TODO decode data here, so gaps can be accomodated for requested width?
-	channels: int = len(mode)
-
 	# TODO Use alpha channel for degenerate data
+	decoded = np.asarray(decoded)
+	height = image_height(len(decoded), width, mode)
 
-	if mode == 'P':
-		fill = RGB_MAX
-		padded = np.array(pad_end(decoded, fill, n=width))
-		uint8 = np.uint8(padded)
-	else:
-		padded = np.array(pad_end(decoded, fill, n=3 * width))
-		uint8 = num_to_pixel(padded, amino, degen)
-
-	height = height_for(padded, width, channels)
+	if out is None:
+		out = np.empty(image_shape(height, width, mode), dtype=np.uint8)
+	assert out.shape[0] == height, 'Output height does not match data'
 
-	if channels > 1:
-		rgb = uint8.reshape(height, width, channels)
+	flat = out.reshape(-1)
+	if mode == 'P':
+		flat[:len(decoded)] = decoded
+		flat[len(decoded):] = RGB_MAX
 	else:
-		rgb = uint8.reshape(height, width)
+		flat[:len(decoded)] = num_to_pixel(decoded, amino, degen)
+		flat[len(decoded):] = num_to_pixel(np.asarray(fill), amino, degen)
 
-	return rgb
+	return out
 
 
 def dna_image_seq(
@@ -80,13 +103,11 @@ def dna_quad_image(
 
 	# Compare this with dna_image_data!
 	channels = 3
-	fill = (0, 0, 0)
+	height = -(-len(rgb) // (channels * width)) * channels
 
-	padded = np.array(pad_end(rgb, fill, n=channels * width))
-	uint8 = np.uint8(padded)
-
-	height = height_for(padded, width, channels)
-	pixels = uint8.reshape(height, width, channels)
+	# Pad with black pixels to whole blocks of rows
+	pixels = np.zeros((height, width, channels), dtype=np.uint8)
+	pixels.reshape(-1, channels)[:len(rgb)] = rgb
 
 	return pixels
 
@@ -96,8 +117,15 @@ def dna_image(
 	*,
 	length=1,
 	amino=False, degen=False, table=1,
+	jobs=1,
 ) -> Image.Image:
-	"""DNA data as full colour image in various modes."""
+	"""DNA data as full colour image in various modes.
+
+	Except for mode Q, all the sequences are decoded before the image is
+	allocated, so the decoded codon numbers (one byte per codon, four when
+	degenerate) are held in memory together with the image. Each sequence
+	is released as soon as its rows have been filled.
+	"""
 	if mode == 'Q':
 		rgb = np.vstack([
 			dna_quad_image(
@@ -109,12 +137,21 @@ def dna_image(
 		])
 		mode = 'RGB'
 	else:
-		rgb = np.vstack([
-			dna_image_seq(
-				seq, width, mode, fill=0,
-				amino=amino, degen=degen, table=table)
-			for seq in seqs
-		])
+		# Decode first to know the heights, then fill a preallocated image
+		decode = partial(dna.decode_seq, amino=amino, table=table, degen=degen)
+		decoded = deque(data for data, _ in pmap(decode, seqs, jobs))
+		heights = [image_height(len(data), width, mode) for data in decoded]
+		rgb = np.empty(image_shape(sum(heights), width, mode), dtype=np.uint8)
+
+		offset = 0
+		for height in heights:
+			data = decoded.popleft()
+			dna_image_data(
+				data, width, fill=0, mode=mode,
+				amino=amino, degen=degen,
+				out=rgb[offset:offset + height],
+			)
+			offset += height
 
 	img = Image.fromarray(rgb, mode)
 
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import itertools as itr
-
 import more_itertools as mit
 import numpy as np
 
@@ -10,14 +8,38 @@ from serpent.fun import str_join
 
 
 def all_symbols_for(fmt, seql, table=1):
+	"""All combinations of symbols of length seql in product order.
+
+	Builds an index table of the combinations and gathers the symbols
+	with it, viewing each row of symbols as a single string.
+	"""
 	item_size = seql * 3 if fmt in ['c', 'codon'] else seql
-	dtype = f'U{item_size}'
-	symbols = symbols_for(fmt, table)
-	combos = np.fromiter(map(str_join, itr.product(symbols, repeat=seql)), dtype=dtype)
+	symbols = np.array([*symbols_for(fmt, table)])
+	indices = np.indices((len(symbols),) * seql).reshape(seql, -1).T
+	combos = np.ascontiguousarray(symbols[indices]).view(f'U{item_size}').ravel()
 
 	return combos
 
 
 def peptides_of_length(encoded, seql):
-	"""Return peptides of sequence length from encoded data."""
-	yield from (str_join(pep) for pep in mit.chunked(encoded, seql))
+	"""Return peptides of sequence length from encoded data.
+
+	Equal width symbols are joined into peptides by reinterpreting
+	the symbol array as a wider string dtype.
+
+	>>> [*peptides_of_length(['GGG', 'GAG', 'CCC', 'TTT', 'TAG'], 2)]
+	['GGGGAG', 'CCCTTT', 'TAG']
+	"""
+	symbols = np.array([*encoded], dtype=str)
+	lengths = np.char.str_len(symbols)
+	if len(symbols) == 0 or np.any(lengths != lengths[0]):
+		yield from (str_join(pep) for pep in mit.chunked(symbols.tolist(), seql))
+		return
+
+	width = lengths[0]
+	full = len(symbols) - len(symbols) % seql
+	peptides = symbols[:full].view(f'U{width * seql}')
+
+	yield from peptides.tolist()
+	if full < len(symbols):
+		yield str_join(symbols[full:].tolist())
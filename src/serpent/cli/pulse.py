@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
-
-import numpy as np
+from functools import partial
 
 from serpent import dna
 from serpent.io.printing import format_quasar, format_quasar_pulses
-from serpent.math.statistic import count_sorted, quasar_pulses
+from serpent.math.statistic import count_sorted, quasar_pulses, sum_counts
+from serpent.parallel import pmap
 from serpent.settings import PLOT_FONT_SIZE
 from serpent.visual.palette import spectrum_layer_colours_for
 
@@ -50,20 +49,30 @@ def pulse_plot_symbols_legend(ax, key, colours, width, height):
 		)
 
 
+def sequence_pulses(seq, key, *, amino=False, table=1, degen=False, cumulative=False):
+	"""Get the symbol pulses and descriptions of a single sequence."""
+	[aminos, descriptions] = dna.decode_seq(seq, amino, table, degen, dna.to_amino)
+	pulses, height, scale = quasar_pulses(aminos, cumulative=cumulative, key=key)
+
+	return pulses, height, scale, descriptions
+
+
 # ruff: noqa: PLR0913 # Too many arguments in function definition
 def pulse_plot_sequences(
 	ax, seqs, key,
 	*,
 	amino=False, table=1, degen=False,
 	count=False, cumulative=False,
+	jobs=1,
 ):
 	colours = spectrum_layer_colours_for(key, amino)
 	maxheight = maxscale = 0
-	sum_pulses = defaultdict(int)
+	sorted_pulses = []
+	pulses_for = partial(
+		sequence_pulses, key=key,
+		amino=amino, table=table, degen=degen, cumulative=cumulative)
 
-	for seq in seqs:
-		[aminos, descriptions] = dna.decode_seq(seq, amino, table, degen, dna.to_amino)
-		pulses, height, scale = quasar_pulses(aminos, cumulative=cumulative, key=key)
+	for pulses, height, scale, _ in pmap(pulses_for, seqs, jobs):
 		maxheight = max(height, maxheight)
 		maxscale = max(scale, maxscale)
 
@@ -75,15 +84,12 @@ def pulse_plot_sequences(
 			pos = mx - i
 
 			if count:
-				sorted_pulse = pulse_plot_counts(ax, pulse, colour, base=10)
-				for repeat, counted in sorted_pulse.T:
-					sum_pulses[repeat] += counted
+				sorted_pulses.append(pulse_plot_counts(ax, pulse, colour, base=10))
 			else:
 				pulse_plot(ax, pulse, colour, symbol=aa, y_offset=pos * 100)
 
 	if count:
-		# sum pulses
-		sum_pulses = np.array([*sorted(sum_pulses.items())]).T
+		sum_pulses = sum_counts(sorted_pulses)
 		ax.plot(*sum_pulses, color='#2227')
 
 		# symbols legend
@@ -40,8 +40,12 @@ def dna_quasar_seq(
 def pulses_to_rgb(pulses, scale, mod=0, log=False, test=False) -> NDArray[np.uint8]:
 	"""Convert pulse repetition data to RGB values."""
 	# yield from format_quasar_pulses(pulses, height)
-	# OR same data as Numpy array:
-	arr = np.vstack([*pulses.values()]).T
+	# OR same data as Numpy array with a column for each symbol:
+	columns = [*pulses.values()]
+	height = max(len(column) for column in columns)
+	arr = np.zeros((height, len(columns)), dtype=np.result_type(*columns))
+	for i, column in enumerate(columns):
+		arr[:len(column), i] = column
 
 	if test:
 		arr = np.arange(np.prod(arr.shape)).reshape(arr.shape)
@@ -1,42 +1,70 @@
 from __future__ import annotations
 
 import matplotlib.pyplot as plt
-import more_itertools as mit
 import numpy as np
 
 from serpent.cli.entropy import check_step_size
-from serpent.math.statistic import symbol_frequencies
+from serpent.fun import as_ascii
+from serpent.math.statistic import symbol_lut
 from serpent.visual.palette import hex_spectrum
 
 
 def sequence_probabilities(data, symbols, seql=64, step=None):
+	"""Symbol probabilities on windows of seql over data.
+
+	The symbol counts of each window are differences of cumulative counts,
+	so the cost does not depend on the window length.
+	"""
 	step = check_step_size(seql, step)
-	seqs = mit.windowed(data, seql, step=step, fillvalue='')
+	indices = symbol_lut(symbols)[as_ascii(data)]
 
-	probabilities = (symbol_frequencies(seq, symbols) for seq in seqs)
+	# Pad with non-symbols to fill the last window like mit.windowed
+	length = len(indices)
+	padding = seql - length if length < seql else -(length - seql) % step
+	indices = np.concatenate([indices, np.full(padding, len(symbols))])
 
-	yield from probabilities
+	starts = np.arange(0, len(indices) - seql + 1, step)
+	counts = np.empty((len(starts), len(symbols)), dtype=np.int32)
+	cumulative = np.zeros(len(indices) + 1, dtype=np.int32)
 
+	for i in range(len(symbols)):
+		np.cumsum(indices == i, out=cumulative[1:])
+		counts[:, i] = cumulative[starts + seql] - cumulative[starts]
 
-def tide_normalise(tides, total):
-	scale = total[-1]
-	tides = tides / scale
-	total = total / scale
+	with np.errstate(invalid='ignore'):
+		probabilities = counts / np.sum(counts, axis=1, keepdims=True)
 
-	return tides, total
+	return probabilities
 
 
 def tide_total(tides, norm=False, color='#000000'):
-	total = np.sum(tides, axis=1)
+	# Matrix-vector product sums the short rows faster than np.sum
+	total = tides @ np.ones(tides.shape[1])
 
 	if norm:
-		[tides, total] = tide_normalise(tides, total)
+		total /= total[-1]
 
 	plt.plot(total, color=color)
 
 	return total
 
 
+def repeated_cumsum(data, repeats: int):
+	"""Cumulative sum of data with each row repeated, without the repeated array.
+
+	>>> repeated_cumsum(np.array([[1, 2], [3, 4]]), 2).tolist()
+	[[1, 2], [2, 4], [5, 8], [8, 12]]
+	"""
+	preceding = np.cumsum(data, axis=0) - data
+	counts = np.arange(1, repeats + 1).reshape(-1, *[1] * (data.ndim - 1))
+
+	out = np.empty((len(data), repeats, *data.shape[1:]), dtype=data.dtype)
+	np.multiply(counts, data[:, np.newaxis], out=out)
+	out += repeats * preceding[:, np.newaxis]
+
+	return out.reshape(-1, *data.shape[1:])
+
+
 # ruff: noqa: PLR0913
 def tide_sequence(
 	data, symbols, seql,
@@ -48,17 +76,14 @@ def tide_sequence(
 	step = check_step_size(seql, step)
 
 	tides = sequence_probabilities(data, symbols, seql, step)
-	tides = np.array([*tides])
-
-	tides = np.repeat(tides, step, axis=0)
 
 	if cumulative:
-		tides = np.cumsum(tides, axis=1)
+		np.cumsum(tides, axis=1, out=tides)
 
 	if slopes:
-		tides = np.cumsum(tides, axis=0)
+		return repeated_cumsum(tides, step)
 
-	return tides
+	return np.repeat(tides, step, axis=0)
 
 
 def plot_tides(tides, symbols, alpha=None):
@@ -19,7 +19,7 @@ def walk_sequence(
 ):
 	step = check_step_size(seql, step)
 	quads = dna_to_quad(data, length=seql, degen=degen, step=step)
-	dirs = np.array(quads).T if unit else np.cumsum(quads, axis=0).T
+	dirs = quads.T if unit else np.cumsum(quads, axis=0, out=quads).T
 	path = normalise(dirs) if norm else dirs if unit else dirs * step
 
 	return path
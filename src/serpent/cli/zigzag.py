@@ -1,16 +1,18 @@
 from __future__ import annotations
 
-import colorsys
 import fileinput
-import math
 import sys
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import ClassVar
 
 import blessed
 import numpy as np
 
 from serpent.io.files import check_paths
 from serpent.math.basic import rescale
+from serpent.visual.bitmap import hsv_to_rgb
 from serpent.visual.block_elements import HALF_BLOCK
 
 
@@ -22,6 +24,8 @@ class ZigzagState:
 	dirty: bool = True
 	file_no: int = 0
 	page_no: int = 0
+	frame: list[bytes] = field(default_factory=list, repr=False)
+	size: tuple[int, int] = (0, 0)
 
 	@property
 	def current_input(self):
@@ -41,44 +45,101 @@ class ZigzagState:
 		self.page_no = 0
 		self.dirty = True
 
+	# Key bindings for the actions
+	actions: ClassVar[dict[str, Callable[[ZigzagState], None]]] = {
+		' ': next_input,
+		'b': prev_input,
+	}
 
-def rgb_at_xy(term, x, y, t):
-	h, w = term.height, term.width
-	xw = x - w / 2
-	yh = y - h / 2
+	def key(self, key: str):
+		"""Run the action bound to a key, if any."""
+		action = self.actions.get(key)
+		if action:
+			action(self)
 
-	hue = 4.0 + (
-		math.sin(x / 16)
-		+ math.sin(y / 32)
-		+ math.sin(math.sqrt(xw ** 2 + yh ** 2) / 8 + t * 3)
-	) + math.sin(math.sqrt(x ** 2 + y ** 2) / 8)
-	saturation = y / h
-	lightness = x / w
 
-	rgb = np.array(colorsys.hsv_to_rgb(hue / 8, saturation, lightness))
+@lru_cache(maxsize=4)
+def static_field(width, height):
+	"""Parts of the colour field that do not change between frames.
+
+	Returns the time independent hue, the distance from the screen centre,
+	saturation and lightness. The terms that vary along only one axis
+	are computed on a row or a column and broadcast.
+	"""
+	y = np.arange(height, dtype=float)[:, np.newaxis]
+	x = np.arange(width, dtype=float)[np.newaxis, :]
+
+	hue = 4.0 + (np.sin(x / 16) + np.sin(y / 32)) + np.sin(np.hypot(x, y) / 8)
+	centre = np.hypot(x - width / 2, y - height / 2) / 8
+	saturation = np.broadcast_to(y / height, hue.shape)
+	lightness = np.broadcast_to(x / width, hue.shape)
+
+	return hue, centre, saturation, lightness
+
+
+def rgb_field(width, height, t):
+	"""Colour field of the screen as RGB values for each row and column."""
+	[hue, centre, saturation, lightness] = static_field(width, height)
+	# Reuse the temporary array for the time dependent hue
+	shifted = np.sin(centre + t * 3)
+	shifted += hue
+	shifted /= 8
+
+	rgb = hsv_to_rgb(shifted, saturation, lightness)
 	rgb = rescale(rgb, 256, 65536).astype(np.int32)
 
 	return rgb
 
 
-def screen_page(term, render_fn, t):
-	result = ''
-	for y in range(term.height - 1):
-		for x in range(term.width):
-			fg = term.color_rgb(*render_fn(term, x, y, t))
-			bg = term.on_color_rgb(*render_fn(term, x, y, t + 1))
-			result += bg + fg + HALF_BLOCK
-	return result
+# ruff: noqa: PLR0913 # Too many arguments in function definition
+@lru_cache(maxsize=2 ** 16)
+def colour_cell(term, r, g, b, bg_r, bg_g, bg_b) -> bytes:
+	"""Encode half block with foreground and background colours.
+
+	Cached between frames.
+	"""
+	cell = term.on_color_rgb(bg_r, bg_g, bg_b) + term.color_rgb(r, g, b) + HALF_BLOCK
+
+	return cell.encode()
+
+
+def screen_rows(term, render_fn, t, size) -> list[bytes]:
+	"""Encode rows of the screen above the status line.
+
+	The size is the terminal height and width read once for the frame.
+	"""
+	height, width = size
+	fg = render_fn(width, height, t)[:height - 1]
+	bg = render_fn(width, height, t + 1)[:height - 1]
+	colours = np.concatenate([fg, bg], axis=-1).tolist()
+
+	return [b''.join(colour_cell(term, *colour) for colour in row) for row in colours]
+
+
+def changed_rows(term, rows: list[bytes], previous: list[bytes]) -> bytes:
+	"""Rows that differ from the previous frame, each moved into place.
+
+	Redraws everything when there is no previous frame of the same height.
+	"""
+	if len(rows) != len(previous):
+		return term.home.encode() + b''.join(rows)
+
+	return b''.join(
+		term.move_xy(0, y).encode() + row
+		for y, (row, old) in enumerate(zip(rows, previous, strict=True))
+		if row != old
+	)
 
 
 def status(term, state):
 	left_txt = f'file ({state.file_no + 1} / {state.total}): {state.current_input}'
 	right_txt = f'{term.number_of_colors} colors - ?: help'
+	height, width = state.size
 	return (
-		'\n' + term.normal +
+		term.move_xy(0, height - 1) + term.normal +
 		term.white_on_purple + term.clear_eol +
 		left_txt +
-		term.rjust(right_txt, term.width - len(left_txt))
+		term.rjust(right_txt, width - len(left_txt))
 	)
 
 
@@ -93,29 +154,33 @@ def zigzag_blocks(inputs):
 		state.dirty = True
 		while True:
 			if state.dirty:
-				outp = term.home
-				outp += screen_page(term, rgb_at_xy, state.file_no)
-				outp += status(term, state)
-				print(outp, end='')
-				sys.stdout.flush()
+				size = (term.height, term.width)
+				if state.size != size:
+					state.size = size
+					state.frame = []
+				rows = screen_rows(term, rgb_field, state.file_no, size)
+				out = sys.stdout.buffer
+				out.write(changed_rows(term, rows, state.frame))
+				out.write(status(term, state).encode())
+				out.flush()
+				state.frame = rows
 				state.dirty = False
 
 			key = term.inkey(timeout=None)
-			if key == ' ':
-				state.next_input()
-			elif key == 'b':
-				state.prev_input()
-			elif key == 'q':
+			if key == 'q':
 				break
+			state.key(key)
 
 
 def zigzag_text(inputs):
 	"""Browse DNA data as text paged into variable line widths."""
 	inputs = check_paths(inputs)
 
-	# Read files in binary mode
+	# Read files in binary mode and write the bytes through as they are
+	out = sys.stdout.buffer
 	with fileinput.input(inputs, mode='rb') as fi:
 		while (line := fi.readline()):
 			if fi.isstdin():
-				print('STDIN: ' , end='')
-			print(str(line, encoding='UTF-8', errors='surrogateescape'), end='')
+				out.write(b'STDIN: ')
+			out.write(line)
+	out.flush()
@@ -20,4 +20,4 @@ def convert(func: Callable, seq: Sequence):
 	>>> convert(amino_to_codon, 'WPRPQIPP')
 	'TGGCCTCGTCCTCAAATTCCTCCT'
 	"""
-	return str_join([*map(func, seq)])
+	return str_join(map(func, seq))
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from functools import cache
 
-from serpent.convert.codon import codon_to_num, num_to_codon
+import numpy as np
+from numpy.typing import NDArray
+
+from serpent.convert.codon import codon_to_num, codons_to_nums, num_to_codon
 from serpent.convert.genetic_code import genetic_code, genetic_code_inverse
-from serpent.fun import inverse_od, map_array, str_join
+from serpent.fun import as_ascii, inverse_od, str_join, translate_ascii
 
 aa_tables = list(genetic_code.keys())
 
@@ -21,8 +25,15 @@ degenerate_amino = OrderedDict({
 degenerate_codon = inverse_od(degenerate_amino)
 
 
+# Codons of each translation table merged with the degenerate codons
+codon_aminos = OrderedDict([
+	(key, {**code, **degenerate_amino})
+	for key, code in genetic_code.items()
+])
+
+
 def codon_to_amino(codon, table=1):
-	return degenerate_amino.get(codon) or genetic_code[table][codon]
+	return codon_aminos[table][codon]
 
 # ruff: noqa: F601
 # multi-value-repeated-key-literal
@@ -32,18 +43,77 @@ def amino_to_codon(amino, table=1):
 
 
 def amino_to_num(amino: str, table: int=1) -> int:
-	"""Decode an amino acid IUPAC string into a number between 0 and 63."""
-	try:
-		codon = amino_to_codon(amino, table)
-	except KeyError:
+	"""Decode an amino acid IUPAC string into a number between 0 and 63.
+
+	Degenerate amino acids and unknown symbols are decoded as zero.
+	"""
+	if amino in degenerate_codon:
 		return 0  # TODO Handle degenerate data
-	return codon_to_num(codon)
+	codon = genetic_code_inverse[table].get(amino)
+
+	return codon_to_num(codon) if codon else 0
+
+
+@cache
+def amino_table(table: int=1) -> NDArray[np.str_]:
+	"""Amino acids for all 64 codon numbers of a translation table."""
+	code = genetic_code[table]
+	return np.array([code[num_to_codon(number)] for number in range(64)])
+
+
+@cache
+def amino_codons(table: int=1) -> dict[str, NDArray[np.intp]]:
+	"""Numbers of all the codons for each amino acid of a translation table.
+
+	Unlike genetic_code_inverse, which keeps only one codon per amino acid:
+
+	>>> amino_codons()['W'], amino_codons()['M']
+	(array([48]), array([28]))
+	"""
+	aminos = amino_table(table)
+	order = np.argsort(aminos, kind='stable')
+	[symbols, first] = np.unique(aminos[order], return_index=True)
+
+	return dict(zip(symbols.tolist(), np.split(order, first[1:]), strict=True))
 
 
 def num_to_amino(number: int, table: int=1) -> str:
 	"""Encode a number between 0 and 63 into an amino acid IUPAC string."""
-	codon = num_to_codon(number)
-	return codon_to_amino(codon, table)
+	return str(amino_table(table)[number])
+
+
+@cache
+def translation_matrix() -> NDArray[np.uint8]:
+	"""ASCII codes of amino_table with one row for each table in aa_tables."""
+	return np.stack([as_ascii(str_join(amino_table(table))) for table in aa_tables])
+
+
+def translate_nums(numbers, tables=1) -> NDArray[np.uint8]:
+	"""Gather ASCII amino acid codes for codon numbers.
+
+	Tables broadcast against the numbers, so each codon can use its own table:
+
+	>>> translate_nums([49, 49, 28], [1, 2, 2]).tobytes()
+	b'*WM'
+	"""
+	rows = np.searchsorted(aa_tables, tables)
+	if not np.array_equal(np.take(aa_tables, rows, mode='clip'), tables):
+		err_msg = f'Unknown translation table: {tables}'
+		raise KeyError(err_msg)
+
+	return translation_matrix()[rows, numbers]
+
+
+def translate(nts, table: int=1) -> str:
+	"""Translate nucleotide bases into a string of amino acids.
+
+	Same as codon_to_amino on each codon, with the last codon filled like
+	codons_to_nums does:
+
+	>>> translate('TGGCCTCGTCC')
+	'WPRP'
+	"""
+	return translate_nums(codons_to_nums(nts), table).tobytes().decode('ascii')
 
 
 aminos = OrderedDict(list(enumerate(genetic_code_inverse[1])))
@@ -51,20 +121,35 @@ aminos = OrderedDict(list(enumerate(genetic_code_inverse[1])))
 aminos_inverse = inverse_od(aminos)
 
 
+amino_lut = np.zeros(256, dtype=np.int8)
+amino_lut[as_ascii(str_join(aminos_inverse))] = [*aminos_inverse.values()]
+
+
 # ruff: noqa: ARG001 # Unused function argument: `table`
-def decode_aminos(
-	dna,
-	# table=1
-):
+def decode_aminos(dna, table=1):
 	"""Decode amino acid data.
 
 	Uses given nucleotide base order and genetic code translation table.
+	Unknown symbols are decoded as zero.
+
+	>>> decode_aminos('MAX*')
+	array([10,  3,  0, 17], dtype=int8)
 	"""
 	# TODO Use genetic code tables?
 	# return map_array(lambda d: amino_to_num(d, table), dna)
-	return map_array(lambda a: aminos_inverse.get(a, 0), dna)
+	if isinstance(dna, np.ndarray) and dna.dtype == np.dtype('<U1'):
+		codes = np.ascontiguousarray(dna).view(np.uint32)
+	else:
+		text = dna if isinstance(dna, str) else str_join(dna)
+		if text.isascii():
+			return translate_ascii(text, amino_lut)
+		codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+	# Symbols outside of the lookup table are unknown
+	return amino_lut[np.where(codes < len(amino_lut), codes, 0)]
 
 
+@cache
 def aminos_for_table(table: int=1):
 	"""Amino acids for a table as string to use as a key."""
 	return str_join(genetic_code_inverse[table].keys())
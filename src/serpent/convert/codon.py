@@ -4,13 +4,17 @@ from __future__ import annotations
 
 import itertools as itr
 from collections import OrderedDict
+from collections.abc import Iterable
 
 import numpy as np
+from numpy.typing import NDArray
 
+from serpent.convert.nucleotide import nt_to_num, nts_to_nums
 from serpent.fun import inverse_od, str_join
 from serpent.settings import BASE_ORDER
 
 CODONS_LEN = 64
+NUCLEOTIDES = frozenset('ACGT')
 
 
 def base_orders():
@@ -19,8 +23,12 @@ def base_orders():
 
 
 def valid_base_order(bases):
-	"""Check that given base order is valid."""
-	return ''.join(sorted(bases)) == 'ACGT'
+	"""Check that given base order is valid.
+
+	>>> valid_base_order('GACT'), valid_base_order('GACC'), valid_base_order('GACTT')
+	(True, False, False)
+	"""
+	return len(bases) == len(NUCLEOTIDES) and set(bases) == NUCLEOTIDES
 
 
 def codons_array(bases=BASE_ORDER):
@@ -40,6 +48,28 @@ def codon_to_num(codon: str) -> int:
 	return codons[codon]
 
 
+def codons_to_nums(nts: Iterable[str], fill: str='A') -> NDArray[np.int8]:
+	"""Decode nucleotide bases into codon numbers between 0 and 63.
+
+	Same as codon_to_num on each codon, with the last codon filled
+	with the fill base. The bases are decoded into two bit numbers,
+	which are combined three at a time into codon numbers:
+
+	>>> codons_to_nums('GATTACA')
+	array([ 7, 54, 21], dtype=int8)
+	"""
+	nums = nts_to_nums(nts)
+	if len(nums) % 3:
+		nums = np.append(nums, np.full(-len(nums) % 3, nt_to_num[fill], dtype=np.int8))
+	codons = nums.reshape(-1, 3)
+
+	decoded = codons[:, 0] << 4
+	decoded |= codons[:, 1] << 2
+	decoded |= codons[:, 2]
+
+	return decoded
+
+
 def num_to_codon(code: int) -> str:
 	"""Encode a number between 0 and 63 into a codon."""
 	return codons_inverse[code]
@@ -3,23 +3,29 @@
 from __future__ import annotations
 
 import itertools as itr
+import math
 from collections import OrderedDict
-from functools import cache, lru_cache
+from functools import cache
 from operator import itemgetter
 
 import more_itertools as mit
 import numpy as np
+from numpy.typing import NDArray
 from pytrie import SortedStringTrie as Trie
 
+from serpent.convert.amino import amino_table
 from serpent.convert.dnt import (
-	compress_dntset,
-	decompress_dnt,
+	bits_dnt_lut,
 	dnt_binomial,
+	dnt_bits_lut,
 	dnt_degree,
-	dnt_include,
+	dnt_to_bits,
+	dnt_to_num,
+	dnts_to_nums,
 )
 from serpent.convert.genetic_code import STANDARD_CODONS, STANDARD_TABLES
-from serpent.fun import inverse_od, str_join
+from serpent.fun import str_join, translate_ascii
+from serpent.settings import BASE_ORDER
 
 CODON_LEN = 3
 DEGEN_MAX = 4096
@@ -32,29 +38,32 @@ def degenerate_codons():
 	return np.array([*degenerates], dtype='U3')
 
 
-inv_degen_codons = OrderedDict([*enumerate(degenerate_codons())])
-degen_codons = inverse_od(inv_degen_codons)
+degen_codon_array = degenerate_codons()
 
 
-def snp_to_degen(codons: list[str]) -> str:
+def snp_to_degen(codons: list[str] | NDArray[np.uint8]) -> str:
 	"""Convert a list of SNP* codons to a degenerate codon.
 
 	* = single nucleotide polymorphic
 
+	Codons can also be given as an array of ASCII codes.
+
 	>>> snp_to_degen(['ACG', 'ACA', 'ACC', 'ACT'])
 	'ACN'
 	>>> snp_to_degen(['ATA', 'ATC', 'ATT'])
 	'ATH'
 
 	"""
-	transposed = [str_join(list(g)) for g in mit.unzip(codons)]
+	text = codons if isinstance(codons, np.ndarray) else str_join(codons)
+	bits = translate_ascii(text, dnt_bits_lut).reshape(-1, CODON_LEN)
 
 	# Assert SNP property of the codons
-	length_check = set(sorted([len(set(g)) for g in transposed])[:-1])
+	length_check = set(sorted([len(np.unique(column)) for column in bits.T])[:-1])
 	err_msg = f'Codons should differ in only one position, got: {codons}'
 	assert length_check == {1}, err_msg
 
-	return str_join([compress_dntset(set(bases)) for bases in transposed])
+	# Combine the bases of each position
+	return bits_dnt_lut[np.bitwise_or.reduce(bits, axis=0)].tobytes().decode('ascii')
 
 
 @cache
@@ -77,41 +86,113 @@ def create_degen_to_amino_map(table: int=1) -> str:
 	return mapping
 
 
+@cache
+def degen_to_amino_trie(table: int=1) -> Trie:
+	"""Prefix tree of the degenerate codon to amino acid mapping."""
+	return Trie(create_degen_to_amino_map(table))
+
+
 def degen_to_amino(degen: str, table: int=1) -> str:
 	"""Convert a degenerate codon to an amino acid."""
-	mapping = create_degen_to_amino_map(table)
+	items = degen_to_amino_trie(table).items(degen[:2])
+	if not items:
+		return 'X'
+	bits = dnt_to_bits[degen[2]]
 
-	t = Trie(mapping)
-	items = t.items(degen[:2])
-
-	matching = [amino for dg, amino in items if dnt_include(degen[2], dg[2])]
+	# Same as dnt_include(degen[2], dg[2]) inlined
+	matching = [amino for dg, amino in items if not bits & ~dnt_to_bits[dg[2]]]
 	amino = matching[0] if len(matching) else 'X'
 
 	return amino
 
 
-@lru_cache(maxsize=3375)
-def degen_to_aminoset(degen: str, table: int=1) -> set:
-	"""Return set of amino acids possibly represented by a degenerate codon."""
-	nt_sets = [decompress_dnt(dnt) for dnt in degen]
-	codons = [str_join(nts) for nts in itr.product(*nt_sets)]
+@cache
+def degen_codon_coverage() -> NDArray[np.bool_]:
+	"""Codons (columns) represented by each degenerate codon (rows).
+
+	A codon is represented when each of its bases is included in the
+	degenerate base on the same position.
+	"""
+	codes = translate_ascii(str_join(degen_codon_array), dnt_bits_lut)
+	bits = codes.reshape(-1, CODON_LEN)
+	base_bits = np.array([dnt_to_bits[nt] for nt in BASE_ORDER], dtype=np.uint8)
+	[first, second, third] = [
+		(bits[:, [i]] & base_bits) != 0 for i in range(CODON_LEN)
+	]
+	included = (
+		first[:, :, None, None] & second[:, None, :, None] & third[:, None, None, :]
+	)
+
+	return included.reshape(len(bits), -1)
+
+
+@cache
+def degen_aminosets(table: int=1) -> dict[str, frozenset[str]]:
+	"""Return sets of amino acids possibly represented by each degenerate codon."""
+	[symbols, amino_index] = np.unique(amino_table(table), return_inverse=True)
+	one_hot = np.eye(len(symbols), dtype=np.float32)[amino_index]
+	present = (degen_codon_coverage().astype(np.float32) @ one_hot) > 0
+
+	# Make one set for each distinct combination of amino acids
+	keys = present @ (1 << np.arange(len(symbols), dtype=np.int64))
+	[_, first, inverse] = np.unique(keys, return_index=True, return_inverse=True)
+	aminosets = [frozenset(symbols[present[row]].tolist()) for row in first]
 
-	return {degen_to_amino(dgn, table) for dgn in codons}
+	aminosets_by_codon = map(aminosets.__getitem__, inverse)
+
+	return dict(zip(degen_codon_array.tolist(), aminosets_by_codon, strict=True))
+
+
+def degen_to_aminoset(degen: str, table: int=1) -> frozenset[str]:
+	"""Return set of amino acids possibly represented by a degenerate codon."""
+	return degen_aminosets(table)[degen]
 
 
 def degen_to_num(codon: str) -> int:
 	"""Decode a single degenerate codon (three letter string) into a number (<4096)."""
 	assert len(codon) == CODON_LEN, 'Invalid codon length.'
-	return degen_codons[codon]
+	# Degenerate codons are numbered in radix order of the degenerate bases
+	[first, second, third] = map(dnt_to_num, codon)
+	return first << 8 | second << 4 | third
 
 
 def num_to_degen(code: int) -> str:
 	"""Encode a number between (<4096) into a degenerate codon."""
-	assert code < DEGEN_MAX, 'Invalid degenerate codon number.'
-	return inv_degen_codons[code]
+	assert 0 <= code < DEGEN_MAX, 'Invalid degenerate codon number.'
+	return degen_codon_array[code]
 
 
-def degeneracy(degen: str):
-	"""Degree of degeneracy for a degenerate codon."""
-	degree = np.prod([dnt_degree(dnt) for dnt in degen])
-	return degree
+def degens_to_nums(dnts, fill: int=0) -> NDArray[np.int16]:
+	"""Decode degenerate bases into degenerate codon numbers (<4096).
+
+	Same as degen_to_num on each codon, with the last codon filled
+	with the degenerate base number fill:
+
+	>>> degens_to_nums('GATTN')
+	array([  76, 3248], dtype=int16)
+	"""
+	nums = dnts_to_nums(dnts).astype(np.int16)
+	if len(nums) % CODON_LEN:
+		fills = np.full(-len(nums) % CODON_LEN, fill, dtype=np.int16)
+		nums = np.append(nums, fills)
+	codons = nums.reshape(-1, CODON_LEN)
+
+	decoded = codons[:, 0] << 8
+	decoded |= codons[:, 1] << 4
+	decoded |= codons[:, 2]
+
+	return decoded
+
+
+def nums_to_degens(numbers) -> NDArray[np.str_]:
+	"""Encode numbers (<4096) into degenerate codons like num_to_degen."""
+	return degen_codon_array[numbers]
+
+
+def degeneracy(degen: str) -> int:
+	"""Degree of degeneracy for a degenerate codon.
+
+	>>> degeneracy('GAN'), degeneracy('RYH'), degeneracy('GAZ')
+	(4, 12, 0)
+	"""
+	return math.prod(map(dnt_degree, degen))
@@ -3,12 +3,33 @@
 from __future__ import annotations
 
 import more_itertools as mit
+import numpy as np
 
 
 def change_base(decoded, base=64, n=3, fill=0):
-	"""Change numeric base of data n digits at a time."""
-	sequences = mit.grouper(decoded, n, incomplete="fill", fillvalue=fill)
-	numbers = (digits_to_num(d, base) for d in sequences)
+	"""Change numeric base of data n digits at a time.
+
+	>>> change_base([1, 2, 3, 4], base=10, n=3)
+	array([123, 400], dtype=uint64)
+	"""
+	if base ** n > np.iinfo(np.uint64).max:
+		# Too large for fixed width integers
+		sequences = mit.grouper(decoded, n, incomplete="fill", fillvalue=fill)
+		return (digits_to_num(d, base) for d in sequences)
+
+	if isinstance(decoded, np.ndarray):
+		digits = decoded.astype(np.uint64)
+	else:
+		digits = np.fromiter(decoded, dtype=np.uint64)
+	if len(digits) % n:
+		digits = np.append(digits, np.full(-len(digits) % n, fill, dtype=np.uint64))
+
+	# Horner's method on the columns of digits
+	rows = digits.reshape(-1, n)
+	numbers = rows[:, 0].copy()
+	for column in rows.T[1:]:
+		numbers *= np.uint64(base)
+		numbers += column
 
 	return numbers
 
@@ -16,8 +37,8 @@ def change_base(decoded, base=64, n=3, fill=0):
 def digits_to_num(seq, base=64):
 	"""Convert digits sequence into a number in given base."""
 	number = 0
-	for i, digit in enumerate(reversed(seq)):
-		number = number + base ** i * digit
+	for digit in seq:
+		number = number * base + int(digit)
 
 	return number
 
@@ -6,7 +6,10 @@ from collections import OrderedDict
 from functools import reduce
 from operator import or_
 
-from serpent.fun import inverse_od, second, str_join
+import numpy as np
+from numpy.typing import NDArray
+
+from serpent.fun import as_ascii, inverse_od, second, str_join, translate_ascii
 from serpent.math.bits import popcount
 from serpent.math.combinatorics import unspread
 from serpent.settings import BASE_ORDER
@@ -20,7 +23,8 @@ def is_degenerate(nts: str, bases: str=BASE_ORDER) -> bool:
 
 	Accepts a string of nucleotides or single codon.
 	"""
-	return not (set(nts) <= set(bases))
+	# Stripping the bases from the ends leaves something only if a symbol is not a base
+	return bool(nts.strip(bases))
 
 
 def binomial_dnt(bases=BASE_ORDER):
@@ -90,6 +94,19 @@ dnt_to_bits = inverse_exp_dnt(BASE_ORDER)
 bits_to_dnt = inverse_od(dnt_to_bits)
 
 
+DNT_INVALID = -1
+
+# Bits of the degenerate bases for ASCII codes and back
+dnt_bits_lut = np.zeros(256, dtype=np.uint8)
+dnt_bits_lut[as_ascii(str_join(dnt_to_bits))] = [*dnt_to_bits.values()]
+bits_dnt_lut = np.zeros(16, dtype=np.uint8)
+bits_dnt_lut[[*bits_to_dnt]] = as_ascii(str_join(bits_to_dnt.values()))
+
+# Numbers of the degenerate bases for ASCII codes
+dnt_lut = np.full(256, DNT_INVALID, dtype=np.int8)
+dnt_lut[as_ascii(str_join(inv_dnt_binomial))] = [*inv_dnt_binomial.values()]
+
+
 def num_to_dnt(num: int) -> str:
 	"""Convert number (<16) to degenerate nucleotide base."""
 	return dnt_binomial[num]
@@ -100,6 +117,21 @@ def dnt_to_num(dnt: str) -> int:
 	return inv_dnt_binomial[dnt]
 
 
+def dnts_to_nums(dnts) -> NDArray[np.int8]:
+	"""Convert degenerate nucleotide bases to numbers (<16) like dnt_to_num.
+
+	>>> dnts_to_nums('GANZ')
+	array([ 0,  4, 11, 15], dtype=int8)
+	"""
+	text = dnts if isinstance(dnts, str) else str_join(dnts)
+	nums = translate_ascii(text, dnt_lut)
+	invalid = nums == DNT_INVALID
+	if np.any(invalid):
+		raise KeyError(text[np.argmax(invalid)])
+
+	return nums
+
+
 def dntset_to_bits(dntset: DntSet) -> DntBits:
 	"""Convert a set of nucleotides to an integer representing four bits.
 
@@ -139,8 +171,13 @@ def decompress_dnt(dnt: Dnt, bases=BASE_ORDER) -> set:
 	"""Expand DNT to nucleotide bases (G, A, C, T).
 
 	Complementary to compress_dntset.
+
+	>>> sorted(decompress_dnt('R')), decompress_dnt('Z')
+	(['A', 'G'], set())
 	"""
 	assert dnt in dnt_to_bits, f'DNT not found: {dnt}'
+	if bases == BASE_ORDER:
+		return set(dnt_bases[dnt])
 	return {str_join(nt) for nt in bases if dnt_include(nt, dnt or 'Z')}
 
 
@@ -154,7 +191,16 @@ def dnt_include(dnt: Dnt, mask: Dnt) -> bool:
 	return bits_include(bits, mask)
 
 
+dnt_degrees = OrderedDict([(dnt, popcount(bits)) for dnt, bits in dnt_to_bits.items()])
+
+
+# Nucleotide bases of each DNT
+dnt_bases = OrderedDict([
+	(dnt, frozenset(nt for nt in BASE_ORDER if dnt_include(nt, dnt)))
+	for dnt in dnt_to_bits
+])
+
+
 def dnt_degree(dnt: str) -> int:
 	"""Degree of degeneracy for a degenerate nucleotide symbol."""
-	bits = dnt_to_bits[dnt]
-	return popcount(bits)
+	return dnt_degrees[dnt]
@@ -39,10 +39,14 @@ from __future__ import annotations
 from collections import OrderedDict
 from typing import NamedTuple
 
-from serpent.convert.codon import CODONS_LEN, codons_array
-from serpent.fun import find_offsets, inverse_od
+import numpy as np
+from numpy.typing import NDArray
+
+from serpent.convert.codon import CODONS_LEN, codons_array, codons_to_nums
+from serpent.fun import as_ascii, inverse_od
 
 STANDARD_CODONS = codons_array('GACT')
+STANDARD_CODON_NUMS = codons_to_nums(STANDARD_CODONS)
 
 
 class GeneticCode(NamedTuple):
@@ -52,16 +56,25 @@ class GeneticCode(NamedTuple):
 	raw: str
 	start: set
 	stop: set
+	start_mask: NDArray[np.bool_]
+	stop_mask: NDArray[np.bool_]
 
 
 def genetic_code_map(table: str, codons: str=STANDARD_CODONS) -> OrderedDict[str, str]:
-	table = OrderedDict(zip(codons, table, strict=False))
+	table = OrderedDict(zip(np.asarray(codons).tolist(), table, strict=False))
 	assert len(table) == CODONS_LEN, 'Codons and table should have 64 characters.'
 	return table
 
 
 def special_set(codons, special: str, marker: str):
-	return set(codons[[*find_offsets(special, marker)]])
+	return set(codons[as_ascii(special) == ord(marker)])
+
+
+def special_mask(numbers, special: str, marker: str) -> NDArray[np.bool_]:
+	"""Mark the special codons by codon number."""
+	mask = np.zeros(CODONS_LEN, dtype=bool)
+	mask[numbers[as_ascii(special) == ord(marker)]] = True
+	return mask
 
 
 def code_table(
@@ -75,7 +88,14 @@ def code_table(
 	start = special_set(codons, special, 'M')
 	stop = special_set(codons, special, '*')
 
-	return GeneticCode(code, raw, start, stop)
+	if codons is STANDARD_CODONS:
+		numbers = STANDARD_CODON_NUMS
+	else:
+		numbers = codons_to_nums(codons)
+	start_mask = special_mask(numbers, special, 'M')
+	stop_mask = special_mask(numbers, special, '*')
+
+	return GeneticCode(code, raw, start, stop, start_mask, stop_mask)
 
 
 sgc = code_table
@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from collections.abc import Iterable
 
-from serpent.fun import inverse_od
+import numpy as np
+from numpy.typing import NDArray
+
+from serpent.fun import as_ascii, inverse_od, str_join, translate_ascii
 from serpent.settings import BASE_ORDER
 
 __all__ = [
 	'nt_to_num',
+	'nts_to_nums',
 	'num_to_nt',
 ]
 
+NT_INVALID = -1
+
 # TODO: Mapping order and numbering could be distinct if using a gray code like
 # scheme. For example: With GACT/GACU order the numbering could be 2013, which
 # would be the same as ACGT in linear ordering.
@@ -30,3 +37,22 @@ __all__ = [
 
 num_to_nt = OrderedDict(enumerate(BASE_ORDER))
 nt_to_num = inverse_od(num_to_nt)
+
+# Two bit codes of the bases for ASCII codes
+nt_lut = np.full(256, NT_INVALID, dtype=np.int8)
+nt_lut[as_ascii(BASE_ORDER)] = [*nt_to_num.values()]
+
+
+def nts_to_nums(nts: Iterable[str]) -> NDArray[np.int8]:
+	"""Decode nucleotide bases into numbers between 0 and 3 like nt_to_num.
+
+	>>> nts_to_nums('GATTACA')
+	array([0, 1, 3, 3, 1, 2, 1], dtype=int8)
+	"""
+	text = nts if isinstance(nts, str) else str_join(nts)
+	nums = translate_ascii(text, nt_lut)
+	invalid = nums == NT_INVALID
+	if np.any(invalid):
+		raise KeyError(text[np.argmax(invalid)])
+
+	return nums
@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import itertools as itr
 from collections import OrderedDict
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 
 import more_itertools as mit
 import numpy as np
+from numpy.typing import NDArray
 
-from serpent.convert.dnt import bits_to_dnt, dnt_to_bits
-from serpent.fun import str_join
+from serpent.convert.dnt import compress_dntset
+from serpent.fun import as_ascii, str_join
 from serpent.settings import BASE_ORDER
 from serpent.visual.bitmap import yiq_to_rgb
 
@@ -32,9 +33,7 @@ def peptide_to_quad(peptide: Iterable[str]):
 def create_dnt_to_quad(bases=BASE_ORDER):
 	def quad_mapping(nts: str) -> tuple[str, tuple[float, float, float]]:
 		"""Map string (combination) of nongenerate bases into YIQ quad value."""
-		# TODO Use map with operator.or_?
-		summed = np.sum([dnt_to_bits[nt] for nt in nts])
-		dnt = bits_to_dnt[summed]
+		dnt = compress_dntset(nts)
 		quad = np.concatenate([[1 - (len(nts) / len(bases))], peptide_to_quad(nts)])
 		return (dnt, quad)
 
@@ -54,15 +53,66 @@ def degen_to_quad(peptide: Iterable[str]):
 	return np.mean(quads, axis=0)
 
 
-def dna_to_quad(dna: Iterable[str], length=3, degen=False, step=1):
-	convert = degen_to_quad if degen else peptide_to_quad
+# Common denominator of the quad values, so that windows can be summed exactly
+QUAD_SCALE = 12
+QUAD_INVALID = np.iinfo(np.int64).min
+
+
+def quad_lut(mapping: Mapping[str, Iterable[float]]) -> NDArray[np.int64]:
+	"""Make a lookup table of scaled quad values for ASCII codes.
+
+	Codes not in mapping are marked with QUAD_INVALID.
+	"""
+	quads = np.array([*mapping.values()])
+	lut = np.full((256, quads.shape[1]), QUAD_INVALID)
+	lut[as_ascii(str_join(mapping))] = np.rint(quads * QUAD_SCALE)
+
+	return lut
+
+
+nt_quad_lut = quad_lut(nt_to_quad)
+dnt_quad_lut = quad_lut(dnt_to_quad)
+
+
+def window_bounds(length: int, size: int, step: int=1) -> tuple[NDArray, NDArray]:
+	"""Start and end indices of the windows that mit.windowed would yield.
+
+	>>> window_bounds(7, 3, 2)
+	(array([0, 2, 4]), array([3, 5, 7]))
+	>>> window_bounds(6, 3, 2)
+	(array([0, 2, 4]), array([3, 5, 6]))
+	"""
+	if length <= size:
+		starts = np.zeros(min(length, 1), dtype=int)
+	else:
+		starts = np.arange(0, length - size + 1, step)
+		last = starts[-1]
+		if last + max(size, step) < length:
+			# Partial window over the leftover items
+			starts = np.append(starts, last + step)
+
+	return starts, np.minimum(starts + size, length)
+
+
+def dna_to_quad(
+	dna: Iterable[str], length=3, degen=False, step=1
+) -> NDArray[np.float64]:
+	"""Mean quad values on windows of length over DNA data."""
 	# TODO Also try exponential moving average smoothing!
-	chunks = [
-		str_join(filter(None, chunk))
-		for chunk in mit.windowed(dna, length, step=step)
-	]
-	quads = np.array([convert(peptide) for peptide in chunks])
-	return quads
+	lut = dnt_quad_lut if degen else nt_quad_lut
+	codes = as_ascii(dna)
+	values = lut[codes]
+	invalid = values[:, 0] == QUAD_INVALID
+	if np.any(invalid):
+		raise KeyError(chr(codes[invalid][0]))
+
+	sums = np.zeros((len(values) + 1, lut.shape[1]), dtype=np.int64)
+	np.cumsum(values, axis=0, out=sums[1:])
+
+	starts, ends = window_bounds(len(values), length, step)
+	counts = (ends - starts)[:, np.newaxis]
+
+	return (sums[ends] - sums[starts]) / (counts * QUAD_SCALE)
 
 
 def quads_to_rgb(quads, degen=False):
@@ -71,8 +121,9 @@ def quads_to_rgb(quads, degen=False):
 	else:
 		# TODO Handle lightness on dna_to_quad or elsewhere
 		lightness = 0.75
-		luma = np.ones(len(quads)) * lightness
-		yiq = np.vstack([luma, quads.T]).T
+		yiq = np.empty((len(quads), 3))
+		yiq[:, 0] = lightness
+		yiq[:, 1:] = quads
 
 	rgb = yiq_to_rgb(yiq)
 
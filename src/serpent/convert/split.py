@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import itertools as itr
+from contextlib import suppress
+
 import more_itertools as mit
+import numpy as np
+from numpy.typing import NDArray
 
+from serpent.convert.codon import codons_to_nums
 from serpent.convert.genetic_code import STANDARD_TABLES
+from serpent.fun import as_ascii, str_join
 
 
 def splitter_for(start, stop, split='n'):
@@ -38,10 +45,55 @@ def splitter_for(start, stop, split='n'):
 def split_aminos(aminos, start='M', stop='*', split='f'):
 	"""Split amino acid sequence by start and stop codons."""
 	# TODO Get all start and stop codons from the genetic code tables!
-	splitter = splitter_for(start, stop, split)
-	aminos = mit.split_when(aminos, splitter)
+	aminos = list(aminos)
+	text = str_join(aminos)
+
+	if not aminos or len(text) != len(aminos) or not text.isascii():
+		splitter = splitter_for(start, stop, split)
+		yield from mit.split_when(aminos, splitter)
+		return
+
+	codes = as_ascii(text)
+	is_start = np.isin(codes, as_ascii(start))
+	is_stop = np.isin(codes, as_ascii(stop))
+	points = split_points(is_start, is_stop, codes, split)
+	for begin, end in itr.pairwise([0, *points, len(aminos)]):
+		yield aminos[begin:end]
+
+
+def split_points(is_start, is_stop, numbers, split='f') -> list[int]:
+	"""Find indices where splitter_for would start a new region.
+
+	Works on codon masks, so the splitter is evaluated for all codon pairs
+	at once (the first codon never starts a region):
+
+	>>> is_start = np.array([0, 1, 0, 1, 0], dtype=bool)
+	>>> is_stop = np.array([1, 0, 0, 0, 1], dtype=bool)
+	>>> split_points(is_start, is_stop, np.arange(5), 'f')
+	[1, 4]
+	"""
+	if split == 'n':
+		points = is_stop[:-1] & is_start[1:]
+	elif split == 'r':
+		points = (is_stop[:-1] | is_start[1:]) & (numbers[:-1] != numbers[1:])
+	elif split == 'f':
+		# Frames toggle on the first codon of each run of starts or stops
+		events = np.flatnonzero(is_start[1:] | is_stop[1:]) + 1
+		return events[np.diff(is_start[events], prepend=False)].tolist()
+	else:
+		err_msg = 'Unknown split type'
+		raise ValueError(err_msg)
+
+	return (np.flatnonzero(points) + 1).tolist()
+
 
-	yield from aminos
+def codon_numbers(codons: list[str]) -> NDArray[np.int8] | None:
+	"""Codon numbers, or None when some codon is partial or degenerate."""
+	if not codons or set(map(len, codons)) != {3}:
+		return None
+	with suppress(KeyError):
+		return codons_to_nums(str_join(codons))
+	return None
 
 
 def split_nucleotides(
@@ -50,13 +102,19 @@ def split_nucleotides(
 	split='f'
 ):
 	"""Split nucleotide sequence by start and stop codons."""
-	start = STANDARD_TABLES[table].start
-	stop = STANDARD_TABLES[table].stop
+	code = STANDARD_TABLES[table]
+	codons = list(codons)
+	numbers = codon_numbers(codons)
 
-	splitter = splitter_for(start, stop, split)
-	codons = mit.split_when(codons, splitter)
+	if numbers is None:
+		splitter = splitter_for(code.start, code.stop, split)
+		yield from mit.split_when(codons, splitter)
+		return
 
-	yield from codons
+	[start, stop] = [code.start_mask[numbers], code.stop_mask[numbers]]
+	points = split_points(start, stop, numbers, split)
+	for begin, end in itr.pairwise([0, *points, len(codons)]):
+		yield codons[begin:end]
 
 
 def split_encoded(encoded, fmt, table, split='f'):
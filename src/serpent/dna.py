@@ -1,18 +1,24 @@
 """DNA and codons data handling."""
 from __future__ import annotations
 
+import re
 import sys
 from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import cache
 
 import more_itertools as mit
 import numpy as np
 from numpy.typing import NDArray
 
-from serpent.convert.amino import codon_to_amino, decode_aminos
-from serpent.convert.codon import codon_to_num, num_to_codon
-from serpent.convert.degenerate import degen_to_amino, num_to_degen
+from serpent.convert.amino import codon_to_amino, decode_aminos, translate
+from serpent.convert.codon import codons_to_nums, num_to_codon
+from serpent.convert.degenerate import (
+	degen_to_amino,
+	degens_to_nums,
+	num_to_degen,
+	nums_to_degens,
+)
 from serpent.convert.digits import change_base
-from serpent.convert.dnt import dnt_to_num
 from serpent.fun import str_join
 from serpent.io.fasta import (
 	AMINO,
@@ -27,15 +33,30 @@ from serpent.io.fasta import (
 from serpent.io.printing import err
 
 
+@cache
+def encoding_table(fmt: str = 'codon', table: int = 1) -> NDArray[np.str_]:
+	"""Codons or amino acids for all 64 codon numbers."""
+	return np.array([*encode(range(64), fmt, table=table)])
+
+
 def encode(
 	decoded: Iterable[int],
 	fmt: str = 'codon',
-	degen: bool = False
+	degen: bool = False,
+	table: int = 1,
 ) -> Iterable[str]:
-	"""Encode data into codons."""
+	"""Encode decoded codon numbers into codons or amino acids."""
+	convert = num_to_degen if degen else num_to_codon
+	if isinstance(decoded, np.ndarray) and not degen:
+		return encoding_table(fmt, table)[decoded].tolist()
+	if isinstance(decoded, np.ndarray) and fmt in ['c', 'codon']:
+		return nums_to_degens(decoded).tolist()
+
 	if fmt in ['c', 'codon']:
-		convert = num_to_degen if degen else num_to_codon
 		encoded = (convert(num) for num in decoded)
+	elif fmt in ['a', 'amino']:
+		to_symbol = degen_to_amino if degen else codon_to_amino
+		encoded = (to_symbol(convert(num), table) for num in decoded)
 	else:
 		raise ValueError('Unknown format: ' + fmt)
 
@@ -56,9 +77,11 @@ def to_amino(
 		yield from cleaned
 	else:
 		# Convert from codons
-		codons = get_codons_iter(cleaned)
-		convert = degen_to_amino if degen else codon_to_amino
-		yield from (convert(c, table) for c in codons)
+		if degen:
+			codons = get_codons_iter(cleaned)
+			yield from (degen_to_amino(c, table) for c in codons)
+		else:
+			yield from translate(cleaned, table)
 
 
 def decode(
@@ -82,6 +105,8 @@ def decode(
 def _decoded_array(decoded: Iterable, degen: bool=False) -> NDArray:
 	"""Return iterable decoded data as Numpy array."""
 	dtype = np.int32 if degen else np.int8
+	if isinstance(decoded, np.ndarray):
+		return decoded.astype(dtype, copy=False)
 	decoded = np.fromiter(decoded, dtype)
 
 	return decoded
@@ -107,11 +132,9 @@ def decode_iter(
 	if degen:
 		# Handle degenerate data as individual symbols in base 16
 		# and combine to degenerate codons
-		b16 = map(dnt_to_num, dna)
-		return change_base(b16, base=16, n=3)
+		return degens_to_nums(dna)
 	else:
-		codons = get_codons_iter(dna)
-		return map(codon_to_num, codons)
+		return codons_to_nums(dna)
 
 
 def decode_seq(
@@ -128,10 +151,8 @@ def decode_seq(
 	return decoded, descriptions
 
 
-def cleaned_and_residual(
-	data: Iterable, amino: bool=False, degen: bool=False,
-) -> tuple[Iterable[str], Iterable[str]]:
-	"""Get cleaned and residual data from DNA or protein sequence."""
+def data_codes(amino: bool=False, degen: bool=False) -> str:
+	"""Return valid symbols of DNA or protein data."""
 	# TODO Handle non-coding DNA marked with lowercase symbols.
 	# TODO Convert RNA data into DNA, so everything can be handled in base 4 or
 	# base 64, and convert back when printing if necessary.
@@ -142,9 +163,42 @@ def cleaned_and_residual(
 		else:
 			CODES += DEGENERATE
 
-	(residual, cleaned) = mit.partition(lambda c: c in CODES, data)
-	# Filter out whitespace from residual
-	(residual, _) = mit.partition(RE_WHITESPACE.match, residual)
+	return CODES
+
+
+@cache
+def non_code_pattern(amino: bool=False, degen: bool=False) -> re.Pattern:
+	"""Compiled pattern for symbols that are not valid codes of the data."""
+	return re.compile(f'[^{re.escape(data_codes(amino, degen))}]')
+
+
+@cache
+def ascii_delete_tables(amino: bool=False, degen: bool=False) -> tuple[bytes, bytes]:
+	"""ASCII codes to delete with bytes.translate to get cleaned and residual data."""
+	codes = data_codes(amino, degen)
+	symbols = [chr(code) for code in range(128)]
+	cleaned = str_join(c for c in symbols if c not in codes)
+	residual = str_join(c for c in symbols if c in codes or c.isspace())
+
+	return cleaned.encode('ascii'), residual.encode('ascii')
+
+
+def cleaned_and_residual(
+	data: Iterable, amino: bool=False, degen: bool=False,
+) -> tuple[str, str]:
+	"""Get cleaned and residual data from DNA or protein sequence."""
+	text = data if isinstance(data, str) else str_join(data)
+
+	if text.isascii():
+		ascii_text = text.encode('ascii')
+		[not_cleaned, not_residual] = ascii_delete_tables(amino, degen)
+		cleaned = ascii_text.translate(None, not_cleaned).decode('ascii')
+		residual = ascii_text.translate(None, not_residual).decode('ascii')
+	else:
+		pattern = non_code_pattern(amino, degen)
+		cleaned = pattern.sub('', text)
+		# Filter out whitespace from residual
+		residual = RE_WHITESPACE.sub('', str_join(pattern.findall(text)))
 
 	yield from (cleaned, residual)
 
@@ -153,10 +207,10 @@ def clean_non_dna(
 	data: Iterable, amino: bool=False, degen: bool=False,
 ) -> tuple[str, str]:
 	"""Clean up non DNA or RNA data."""
-	(cleaned, residual) = map(mit.peekable, cleaned_and_residual(data, amino, degen))
+	[cleaned, residual] = cleaned_and_residual(data, amino, degen)
 
-	if residual.peek(''):
-		err(f'Residual characters: {str_join([*residual])}')
+	if residual:
+		err(f'Residual characters: {residual}')
 		if not degen:
 			err('Try again with the --degen / -g option.')
 			sys.exit(1)
@@ -165,10 +219,16 @@ def clean_non_dna(
 
 
 def get_codons(data, fill="A"):
-	"""Get codons from data as Numpy array."""
-	codons = np.fromiter(get_codons_iter(data, fill), dtype="U3")
+	"""Get codons from data as Numpy array.
+
+	>>> get_codons('GATTACA')
+	array(['GAT', 'TAC', 'AAA'], dtype='<U3')
+	"""
+	text = data if isinstance(data, str) else str_join(data)
+	text += fill * (-len(text) % 3)
 
-	return codons
+	# UTF-32 has the same layout as a Numpy unicode array
+	return np.frombuffer(bytearray(text, 'utf-32-le'), dtype="U3")
 
 
 def get_codons_iter(data, fill="A"):
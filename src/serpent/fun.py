@@ -6,6 +6,7 @@ from collections import OrderedDict
 from collections.abc import ItemsView, Iterable, Mapping, Sequence
 
 import numpy as np
+from numpy.typing import NDArray
 
 
 def is_not_none(x):
@@ -52,3 +53,34 @@ def find_offsets(string, substring):
 def str_join(seq: Iterable, joiner='') -> str:
 	"""Join a sequence into a string."""
 	return joiner.join(seq)
+
+
+def as_ascii(data) -> NDArray[np.uint8]:
+	"""View text data as an array of ASCII codes."""
+	if isinstance(data, np.ndarray) and data.dtype == np.uint8:
+		return data
+	if isinstance(data, bytes | bytearray | memoryview):
+		return np.frombuffer(data, dtype=np.uint8)
+	if not isinstance(data, str):
+		data = str_join(data)
+
+	return np.frombuffer(data.encode('ascii'), dtype=np.uint8)
+
+
+def translate_ascii(data, lut: NDArray) -> NDArray:
+	"""Map the ASCII codes of text data through a one byte lookup table.
+
+	Text is translated with bytes.translate, which is faster than
+	indexing the lookup table with an array of codes.
+
+	>>> translate_ascii('BAC', np.arange(256, dtype=np.uint8) - 65)
+	array([1, 0, 2], dtype=uint8)
+	"""
+	if isinstance(data, np.ndarray):
+		return lut[as_ascii(data)]
+	if isinstance(data, bytes | bytearray | memoryview):
+		text = bytearray(data)
+	else:
+		text = bytearray(data if isinstance(data, str) else str_join(data), 'ascii')
+
+	return np.frombuffer(text.translate(lut.tobytes()), dtype=lut.dtype)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from argparse import ArgumentTypeError
 from collections import OrderedDict
 from collections.abc import Iterable, Iterator, Sequence
 from fileinput import FileInput
@@ -249,14 +250,23 @@ def read_sequences(filename: PathLike, amino: bool=False) -> Iterable[list[Fasta
 	yield from sequences
 
 
-def regex_match(reg, descriptions):
+def compile_regex(reg: str) -> re.Pattern:
+	"""Compile the regexp option of commands once when parsing the options."""
+	try:
+		return re.compile(reg)
+	except re.error as error:
+		err_msg = f'Invalid regexp: {error}'
+		raise ArgumentTypeError(err_msg) from error
+
+
+def regex_match(reg: str | re.Pattern | None, descriptions):
 	"""Allow filtering sequences by regexp option on commands."""
-	return reg is None or re.search(reg, str_join(descriptions)) is not None
+	return reg is None or re.compile(reg).search(str_join(descriptions)) is not None
 
 
-def regex_no_match(reg, descriptions):
+def regex_no_match(reg: str | re.Pattern | None, descriptions):
 	"""Allow skipping sequences that do not match the regexp option on commands."""
-	return reg and re.search(reg, str_join(descriptions)) is None
+	return reg and re.compile(reg).search(str_join(descriptions)) is None
 
 
 def descriptions_and_data(sequence):
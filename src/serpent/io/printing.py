@@ -66,9 +66,24 @@ def format_lines(data, width=80, sep=' '):
 
 
 def reflow(data, width=80):
-	"""Reflow text data into line width."""
+	"""Reflow text data into line width.
+
+	A zero width leaves the text unwrapped on a single line:
+
+	>>> list(reflow(iter('GATTACA'), 3))
+	['GAT', 'TAC', 'A']
+	>>> list(reflow('GATTACA', 0))
+	['GATTACA']
+	>>> list(reflow('', 0))
+	[]
+	"""
 	# TODO Replace str_join with an iterative solution
-	return (str_join(line) for line in mit.chunked(str_join(data), width))
+	text = data if isinstance(data, str) else str_join(data)
+	if not text:
+		return iter(())
+	width = width or len(text)
+
+	return (text[i:i + width] for i in range(0, len(text), width))
 
 
 def format_counter(counts, show_gc=False, *, limit=1, top=None, precision=2):
@@ -112,8 +127,7 @@ def format_quasar_pulses(pulses, height):
 def format_split(regions, width=72, split='n'):
 	for i, region in enumerate(regions):
 		yield f'@split-{split}-{i}'
-		lines = (str_join(line) for line in mit.chunked(str_join(region), width))
-		yield from lines
+		yield from reflow(region, width)
 
 
 def wait_user():
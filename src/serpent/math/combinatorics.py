@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-import itertools as itr
 from collections.abc import Sequence
 
-import more_itertools as mit
 import numpy as np
 
-from serpent.fun import is_not_none
+
+def as_array(seq: Sequence) -> np.ndarray:
+	"""Sequence as a one dimensional array (strings become arrays of characters)."""
+	return seq if isinstance(seq, np.ndarray) else np.asarray(list(seq))
 
 
 def spread(seq: Sequence, n: int, offset: int=0):
@@ -30,9 +31,11 @@ def spread(seq: Sequence, n: int, offset: int=0):
 		return seq
 	assert 1 <= n <= len(seq), 'Parameter N should be strictly between 1 and len(seq)'
 
-	hands = mit.chunked(seq, n)
-	shuffled = [list(hand) for hand in mit.unzip(hands)]
-	cut = np.roll(np.concatenate(shuffled), offset)
+	# Deal the indices into hands of n cards and read them by pile
+	hands = int(np.ceil(len(seq) / n))
+	piles = np.arange(hands * n).reshape(hands, n).T.ravel()
+	shuffled = as_array(seq)[piles[piles < len(seq)]]
+	cut = np.roll(shuffled, offset)
 
 	return cut
 
@@ -54,11 +57,11 @@ def unspread(seq: Sequence, n: int, offset: int=0):
 		return seq
 	assert 1 <= n <= len(seq), 'Parameter N should be strictly between 1 and len(seq)'
 
-	uncut = np.roll(seq, -offset)
-	# FIXME: Oh, why is Python so hostile to functional programming?
-	# Fix this on a better day... and make it clean. (just compare to spread FFS!)
-	unshuffled = [*itr.zip_longest(*mit.chunked(uncut, int(np.ceil(len(seq) / n))))]
-	piles = [list(filter(is_not_none, pile)) for pile in unshuffled]
-	deck = np.concatenate(piles)
+	uncut = np.roll(as_array(seq), -offset)
+	# Split into piles of ceil(len / n) cards and read them by hand
+	size = int(np.ceil(len(seq) / n))
+	piles = int(np.ceil(len(seq) / size))
+	hands = np.arange(piles * size).reshape(piles, size).T.ravel()
+	deck = uncut[hands[hands < len(seq)]]
 
 	return deck
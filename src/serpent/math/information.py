@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import math
 from collections import Counter
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 import numpy as np
+from numpy.typing import NDArray
 
 from serpent.fun import str_join
 from serpent.math.basic import logn, percent
@@ -96,19 +97,28 @@ def statistics_header():
 	], '\t')
 
 
-def statistics(data: Counter | Sequence, base: float=2) -> float:
+def statistics(data: Counter | Sequence, base: float=2) -> str:
 	"""Information statistics."""
 	c = ensure_counter(data)
 
 	entr = entropy_shannon(c, base)
-	max_rate = abs_rate(c, base)
+	total = np.sum([*c.values()])
+
+	return format_statistics(entr, len(c), total, base)
+
+
+def format_statistics(entr: float, cardinality: int, total: int, base: float=2) -> str:
+	"""Format information statistics from entropy and symbol counts."""
+	max_rate = logn(cardinality, base) if cardinality else -np.inf
 	# TODO Check if joint entropy is needed for a stochastic process!
 	# See: https://en.wikipedia.org/wiki/Redundancy_(information_theory)#Quantitative_definition
 	rate = entr
-	total = np.sum([*c.values()])
 	info = entr * total
 
 	abs_red = max_rate - rate
+	if cardinality:
+		# Rounding can make the rate of evenly distributed symbols exceed max rate
+		abs_red = max(0.0, abs_red)
 	rel_red = abs_red / max_rate
 	eff = 1.0 - rel_red
 	max_compr = max_rate / rate
@@ -126,3 +136,113 @@ def statistics(data: Counter | Sequence, base: float=2) -> float:
 		f'{percent(eff, 2) :.2f}%',
 		f'{max_compr :.2f}',
 	], '\t')
+
+
+def symbol_codes(data: Sequence) -> NDArray[np.intp]:
+	"""Map the symbols of data into integer codes 0...K-1."""
+	if isinstance(data, str):
+		symbols = np.frombuffer(data.encode('utf-32-le'), dtype=np.uint32)
+	else:
+		symbols = np.asarray(data)
+	_, codes = np.unique(symbols, return_inverse=True)
+
+	return codes.ravel()
+
+
+def rolling_entropy(
+	data: Sequence, seql: int, step: int=1, base: float=2
+) -> Iterator[tuple[float, int]]:
+	"""Shannon entropy of (possibly overlapping) windows of the data.
+
+	Keeps the symbol counts and the sum of c * log(c) for the current window
+	and updates them only for the symbols leaving and entering the window on
+	each step, so every window costs O(step) instead of O(seql).
+
+	Yields entropy and cardinality (number of unique symbols) for each window.
+
+	>>> [(float(round(h, 3)), k) for h, k in rolling_entropy('GGAA', 2, 1)]
+	[(0.0, 1), (1.0, 2), (0.0, 1)]
+	"""
+	codes = symbol_codes(data).tolist()
+	length = len(codes)
+	seql = min(seql, length)
+	if seql == 0:
+		return
+
+	xlogx = [c * math.log(c) if c else 0.0 for c in range(seql + 1)]
+	log_total = math.log(seql)
+	log_base = math.log(base)
+	counts = [0] * (max(codes) + 1)
+	sum_xlogx = 0.0
+	cardinality = 0
+
+	def entropy():
+		return max(0.0, (log_total - sum_xlogx / seql) / log_base)
+
+	for code in codes[:seql]:
+		c = counts[code]
+		sum_xlogx += xlogx[c + 1] - xlogx[c]
+		cardinality += c == 0
+		counts[code] = c + 1
+	yield entropy(), cardinality
+
+	for start in range(step, length - seql + 1, step):
+		for code in codes[start - step:start]:
+			c = counts[code]
+			sum_xlogx += xlogx[c - 1] - xlogx[c]
+			cardinality -= c == 1
+			counts[code] = c - 1
+		for code in codes[start + seql - step:start + seql]:
+			c = counts[code]
+			sum_xlogx += xlogx[c + 1] - xlogx[c]
+			cardinality += c == 0
+			counts[code] = c + 1
+		yield entropy(), cardinality
+
+
+def block_entropy(
+	data: Sequence, seql: int, base: float=2
+) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+	"""Shannon entropy of non-overlapping windows (blocks) of the data.
+
+	Symbols of all the blocks are counted at once with a single np.bincount
+	by offsetting the codes of each block into their own range.
+
+	Returns entropy and cardinality arrays with values for each full block.
+
+	>>> block_entropy('GGGAGACT', 4)
+	(array([0.81127812, 2.        ]), array([2, 4]))
+	"""
+	codes = symbol_codes(data)
+	seql = min(seql, len(codes))
+	if seql == 0:
+		return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.intp)
+
+	n = len(codes) // seql
+	k = codes.max() + 1
+	blocks = codes[:n * seql].reshape(n, seql) + k * np.arange(n)[:, np.newaxis]
+	counts = np.bincount(blocks.ravel(), minlength=n * k).reshape(n, k)
+
+	xlogx = np.arange(seql + 1) * np.log(np.maximum(np.arange(seql + 1), 1))
+	sum_xlogx = np.sum(xlogx[counts], axis=1)
+	entropy = np.maximum(0.0, (np.log(seql) - sum_xlogx / seql) / np.log(base))
+	cardinality = np.count_nonzero(counts, axis=1)
+
+	return entropy, cardinality
+
+
+def windowed_entropy(
+	data: Sequence, seql: int, step: int=1, base: float=2
+) -> tuple[NDArray[np.float64], NDArray[np.intp]]:
+	"""Shannon entropy and cardinality of windows of the data.
+
+	Uses block_entropy for non-overlapping windows and rolling_entropy
+	when the windows overlap.
+	"""
+	if step == seql:
+		return block_entropy(data, seql, base)
+
+	windows = np.array([*rolling_entropy(data, seql, step, base)], dtype=np.float64)
+	entropy, cardinality = windows.reshape(-1, 2).T
+
+	return entropy, cardinality.astype(np.intp)
@@ -2,10 +2,13 @@
 from __future__ import annotations
 
 from collections import Counter, OrderedDict, defaultdict
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
+from functools import cache
 
 import numpy as np
+from numpy.typing import NDArray
 
+from serpent.fun import as_ascii
 from serpent.padding import pad_end
 
 
@@ -35,8 +38,43 @@ def ac_peaks(ac, limit=0.05):
 
 def count_sorted(items):
 	"""Count items and return as sorted array."""
-	counts = Counter(items)
-	return np.array(sorted(counts.items())).T
+	values = items if isinstance(items, np.ndarray) else np.array([*items])
+	return np.vstack(np.unique(values, return_counts=True))
+
+
+def sum_counts(counted: Iterable[NDArray]) -> NDArray:
+	"""Sum counts of sorted (values, counts) arrays (from count_sorted) by value.
+
+	>>> sum_counts([np.array([[1, 3], [2, 1]]), np.array([[2, 3], [5, 4]])]).tolist()
+	[[1, 2, 3], [2, 5, 5]]
+	"""
+	[values, counts] = np.concatenate([*counted, np.empty((2, 0), dtype=int)], axis=1)
+	[uniq, inverse] = np.unique(values, return_inverse=True)
+	totals = np.bincount(inverse, weights=counts, minlength=len(uniq))
+
+	return np.vstack([uniq, totals.astype(counts.dtype)])
+
+
+def count_groups(items, limit=1) -> Iterator[tuple[int, NDArray]]:
+	"""Group sorted unique items by their counts from the most common.
+
+	Only the items that occur at least limit times are included.
+
+	>>> [(int(c), g.tolist()) for c, g in count_groups(['b', 'a', 'c', 'b', 'a', 'b'])]
+	[(3, ['b']), (2, ['a']), (1, ['c'])]
+	"""
+	values = items if isinstance(items, np.ndarray) else np.array([*items])
+	[uniq, counts] = np.unique(values, return_counts=True)
+	repeated = counts >= limit
+	[uniq, counts] = [uniq[repeated], counts[repeated]]
+
+	if len(counts) == 0:
+		return
+
+	order = np.argsort(-counts, kind='stable')
+	[groups, index] = np.unique(-counts[order], return_index=True)
+
+	yield from zip(-groups, np.split(uniq[order], index[1:]), strict=True)
 
 
 def gc_content(counts: Counter) -> float:
@@ -119,11 +157,13 @@ def quasar_pulses(data, cumulative=False, key=None):
 	return pulses, height, scale
 
 
-def symbol_frequencies(seq, symbols):
-	counts = Counter(seq)
-	freqs = np.array([counts.get(symbol, 0) for symbol in symbols])
+@cache
+def symbol_lut(symbols: str) -> NDArray[np.intp]:
+	"""Lookup table from ASCII codes to the indices of symbols.
 
-	total = np.sum(freqs)
-	probabilities = freqs / total
+	Characters not in symbols map to len(symbols).
+	"""
+	lut = np.full(256, len(symbols), dtype=np.intp)
+	lut[as_ascii(symbols)] = np.arange(len(symbols))
 
-	return probabilities
+	return lut
@@ -0,0 +1,57 @@
+"""Parallel processing utilities."""
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def physical_cores() -> int:
+	"""Estimate the number of physical cores.
+
+	This is only a heuristic: it assumes two hardware threads per core, so it
+	undercounts on machines without simultaneous multithreading. At least one
+	core is always returned.
+	"""
+	return max(1, (os.cpu_count() or 1) // 2)
+
+
+def pmap(
+	fn: Callable[[T], R], iterable: Iterable[T], jobs: int=1, prefetch: int=2
+) -> Iterator[R]:
+	"""Map function over iterable using N processes, preserving the order.
+
+	Use zero jobs for the number of physical cores. With one job the items
+	are mapped lazily in this process. The function and the items must be
+	picklable when using more jobs.
+
+	Items are read lazily also with more jobs: at most prefetch items per job
+	are submitted ahead of the result being consumed.
+
+	>>> list(pmap(abs, [-2, 1, -3]))
+	[2, 1, 3]
+	"""
+	if jobs == 0:
+		jobs = physical_cores()
+	if jobs < 0:
+		err_msg = f'Invalid number of jobs: {jobs}'
+		raise ValueError(err_msg)
+
+	if jobs == 1:
+		yield from map(fn, iterable)
+		return
+
+	with ProcessPoolExecutor(max_workers=jobs) as executor:
+		pending = deque()
+		for item in iterable:
+			if len(pending) >= jobs * max(1, prefetch):
+				yield pending.popleft().result()
+			pending.append(executor.submit(fn, item))
+		while pending:
+			yield pending.popleft().result()
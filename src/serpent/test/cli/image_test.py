@@ -4,7 +4,8 @@ import numpy as np
 from numpy.testing import assert_array_equal
 
 from serpent import dna
-from serpent.cli.image import dna_image_data
+from serpent.cli.image import dna_image, dna_image_data
+from serpent.io.fasta import tokenize
 
 
 def test_dna_image_data():
@@ -24,3 +25,19 @@ def test_dna_image_data():
 	]], dtype=np.uint8)
 
 	assert_array_equal(actual, expected)
+
+
+def test_dna_image_jobs():
+	fasta = [
+		'>first\nGGGGGAGGCAAGAAAAATCCGCCACCCTTATTCTTT\n',
+		'>second\nGATTACA\n',
+		'>third\nATGCCCTAGGACTTTAAGGG\n',
+	]
+	seqs = [[*tokenize(data)] for data in fasta]
+
+	for mode in ['RGB', 'L']:
+		expected = np.asarray(dna_image(seqs, 4, mode, jobs=1))
+		actual = np.asarray(dna_image(seqs, 4, mode, jobs=2))
+
+		assert expected.shape[0] >= len(seqs)
+		assert_array_equal(actual, expected)
@@ -29,3 +29,9 @@ def test_spread_unspread(data):
 		unspread(spread(seq, n, offset), n, offset),
 		seq,
 	)
+
+
+def test_spread_str():
+	assert_array_equal(spread('abcdef', 2), [*'acebdf'])
+	assert_array_equal(spread('abcdefg', 3, offset=1), [*'fadgbec'])
+	assert_array_equal(unspread(spread('abcdef', 2), 2), [*'abcdef'])
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import numpy as np
+
+from serpent.convert.codon import codon_to_num, codons_array, codons_to_nums
+from serpent.fun import str_join
+
+
+def test_codons_to_nums():
+	codons = codons_array()
+	expected = [codon_to_num(codon) for codon in codons]
+	assert codons_to_nums(str_join(codons)).tolist() == expected
+
+
+def test_codons_to_nums_fills_last_codon():
+	assert codons_to_nums('GAT').tolist() == [codon_to_num('GAT')]
+	assert codons_to_nums('GATT').tolist() == [*map(codon_to_num, ['GAT', 'TAA'])]
+	expected = [*map(codon_to_num, ['GAT', 'TAG'])]
+	assert codons_to_nums('GATTA', fill='G').tolist() == expected
+	assert np.size(codons_to_nums('')) == 0
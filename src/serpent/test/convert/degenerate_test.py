@@ -4,6 +4,7 @@ from numpy.testing import assert_array_equal
 
 from serpent import dna
 from serpent.convert.degenerate import degen_to_amino
+from serpent.fun import str_join
 from serpent.test.convert.fixed_degen import fixed_degen_to_amino
 
 
@@ -13,6 +14,13 @@ def test_degen_to_amino():
 		assert degen_to_amino(degen) == expected_map[degen]
 
 
+def test_degen_to_amino_unknown_prefix():
+	# Gaps and lowercase (non-coding) codons have no matches
+	assert degen_to_amino('---') == 'X'
+	assert degen_to_amino('gat') == 'X'
+	assert str_join(dna.to_amino('gattaca', amino=False, table=1, degen=True)) == 'XXX'
+
+
 def test_dna_decode_is_same_for_degenerate():
 	data = 'GGGAAACCCTTT'
 	scale = 52
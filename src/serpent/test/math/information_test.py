@@ -5,7 +5,13 @@ from collections import Counter
 
 import pytest
 
-from serpent.math.information import abs_rate, entropy_shannon
+from serpent.math.information import (
+	abs_rate,
+	block_entropy,
+	entropy_shannon,
+	format_statistics,
+	rolling_entropy,
+)
 
 abs_rates = [
 	(-math.inf, ''),
@@ -59,3 +65,37 @@ def test_entropy_shannon_quad_base(expected, seq):
 @pytest.mark.parametrize(('expected', 'seq'), quad_entropies)
 def test_entropy_shannon_counter_quad_base(expected, seq):
 	assert expected == entropy_shannon(Counter(seq), base=4)
+
+
+@pytest.mark.parametrize(('seql', 'step'), [(1, 1), (4, 1), (5, 2), (8, 8)])
+def test_rolling_entropy(seql, step):
+	seq = 'GATTACAATGCCCTAGGACT'
+	windows = [seq[i:i + seql] for i in range(0, len(seq) - seql + 1, step)]
+	expected = [entropy_shannon(w) for w in windows]
+	actual = [entr for entr, _ in rolling_entropy(seq, seql, step)]
+
+	assert actual == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(('seq', 'seql'), [
+	('GATTACAATGCCCTAGGACT', 4),
+	('GATTACAATGCCCTAGGACT', 3),
+	('GATTACAATGCCCTAGGACT', 1),
+	('GATTACA', 10),
+	('G', 2),
+	('', 3),
+])
+def test_block_entropy_is_same_as_rolling_entropy(seq, seql):
+	expected = [*rolling_entropy(seq, seql, seql)]
+	[entropies, cardinalities] = block_entropy(seq, seql)
+
+	assert entropies.tolist() == pytest.approx([entr for entr, _ in expected])
+	assert cardinalities.tolist() == [cardinality for _, cardinality in expected]
+
+
+def test_format_statistics_has_no_negative_redundancy():
+	# Evenly distributed symbols have rounding errors on the rate
+	[entr], [cardinality] = block_entropy('GAT', 3)
+	stats = format_statistics(entr, cardinality, 3).split('\t')
+
+	assert stats[5:7] == ['0.00', '0.00%']
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import itertools as itr
+
+import pytest
+
+from serpent.parallel import physical_cores, pmap
+
+
+def test_pmap_keeps_order():
+	items = [*range(-20, 20)]
+	assert list(pmap(abs, items, jobs=2)) == list(map(abs, items))
+
+
+def test_pmap_reads_items_lazily():
+	[jobs, prefetch, taken] = [2, 2, 4]
+	items = itr.count()
+	results = pmap(abs, items, jobs=jobs, prefetch=prefetch)
+	assert list(itr.islice(results, taken)) == [*range(taken)]
+	# Only a bounded number of items were submitted ahead
+	assert next(items) <= taken + jobs * prefetch
+
+
+def test_pmap_zero_jobs_uses_physical_cores():
+	assert physical_cores() >= 1
+	assert list(pmap(abs, [-3, 2, -1], jobs=0)) == [3, 2, 1]
+
+
+def test_pmap_negative_jobs():
+	with pytest.raises(ValueError, match='Invalid number of jobs'):
+		list(pmap(abs, [1], jobs=-1))
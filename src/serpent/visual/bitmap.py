@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import colorsys
 from collections.abc import Iterable
 
 import numpy as np
+from numpy.typing import NDArray
 
 from serpent.math.basic import rescale
 from serpent.visual.palette import (
@@ -24,7 +24,7 @@ def to_uint8(data, old=64, offset=0):
 	>>> to_uint8(np.arange(4), 4, offset=1)
 	array([  1,  65, 129, 193], dtype=uint8)
 	"""
-	return np.uint8(rescale(data, old, 256) + offset)
+	return np.uint8(rescale(np.asarray(data, dtype=float), old, 256) + offset)
 
 
 def height_for(data, width, channels=1):
@@ -36,22 +36,50 @@ def height_for(data, width, channels=1):
 
 
 def num_to_pixel(decoded, amino=False, degen=False):
-	"""Convert decoded data into pixel values."""
-	# TODO Check degen amino max_value
-	max_value = (22 if degen else 22) if amino else (4096 if degen else 64)
-	return to_uint8(decoded, max_value, offset=1)  # 1, 5, 9, ..., 249, 253
+	"""Convert decoded data into pixel values.
+
+	Codons map linearly to 1, 5, 9, ..., 249, 253:
+
+	>>> num_to_pixel(np.array([0, 1, 2, 63], dtype=np.int8))
+	array([  1,   5,   9, 253], dtype=uint8)
+	"""
+	decoded = np.asarray(decoded)
+	if amino:
+		# TODO Check degen amino max_value
+		return to_uint8(decoded, 22, offset=1)
+	if degen:
+		# Same as to_uint8(decoded, 4096, offset=1)
+		return (decoded // 16 + 1).astype(np.uint8)
+
+	# Same as to_uint8(decoded, 64, offset=1)
+	pixels = decoded.astype(np.uint8)
+	pixels *= 4
+	pixels += 1
+
+	return pixels
+
+
+def colour_lut(colour_map: dict[int, Rgb]) -> NDArray[np.uint8]:
+	"""Make a lookup table from a colour map with consecutive integer keys."""
+	return np.array([*colour_map.values()], dtype=np.uint8)
+
+
+amino_colour_lut = colour_lut(amino_colour_map)
+codon_colour_lut = colour_lut(codon_colour_map)
+degen_colour_lut = colour_lut(degen_colour_map)
 
 
 def num_to_rgb(decoded, amino=False, degen=False) -> Iterable[Rgb]:
 	"""Convert decoded data into pixel values using a palette."""
 	# TODO Use alpha channel instead!
+	decoded = np.asarray(decoded)
 	if degen and not amino:
 		decoded = decoded // 16
-		colour_map = degen_colour_map
+		lut = degen_colour_lut
 	else:
-		colour_map = amino_colour_map if amino else codon_colour_map
+		lut = amino_colour_lut if amino else codon_colour_lut
 
-	pixels = (colour_map[n] for n in decoded)
+	pixels = lut[decoded].tolist()
 
 	return pixels
 
@@ -68,11 +96,43 @@ def decoded_to_pixels(
 	return pixels
 
 
+def hsv_to_rgb(hue, saturation, value) -> NDArray[np.float64]:
+	"""Convert HSV arrays (0...1) to RGB values like colorsys.hsv_to_rgb.
+
+	>>> hsv_to_rgb(np.array([0, 1/3]), 1, 0.5).tolist()
+	[[0.5, 0.0, 0.0], [0.0, 0.5, 0.0]]
+	"""
+	[hue, saturation, value] = np.broadcast_arrays(
+		np.asarray(hue, dtype=float), saturation, value)
+	sector = np.floor(hue * 6.0)
+	f = hue * 6.0 - sector
+	p = value * (1.0 - saturation)
+	q = value * (1.0 - saturation * f)
+	t = value * (1.0 - saturation * (1.0 - f))
+
+	channels = np.stack([
+		(value, t, p), (q, value, p), (p, value, t),
+		(p, q, value), (t, p, value), (value, p, q),
+	])
+	index = (sector.astype(int) % 6)[np.newaxis, np.newaxis]
+	rgb = np.take_along_axis(channels, index, axis=0)[0]
+
+	return np.moveaxis(rgb, 0, -1)
+
+
 def yiq_to_rgb(yiq):
-	"""Convert YIQ pixel values (+-1) to RGB pixels (0..255)."""
-	rgb = np.apply_along_axis(lambda c: colorsys.yiq_to_rgb(*c), -1, yiq) * 255
+	"""Convert YIQ pixel values (+-1) to RGB pixels (0..255).
 
-	return np.uint8(rgb)
+	Uses the same coefficients as colorsys.yiq_to_rgb.
+	"""
+	[y, i, q] = np.moveaxis(np.asarray(yiq, dtype=float), -1, 0)
+	rgb = np.stack([
+		y + 0.9468822170900693 * i + 0.6235565819861433 * q,
+		y - 0.27478764629897834 * i - 0.6356910791873801 * q,
+		y - 1.1085450346420322 * i + 1.7090069284064666 * q,
+	], axis=-1)
+
+	return np.uint8(np.clip(rgb, 0.0, 1.0) * 255)
 
 
 def yiq_test_image(size: int=8, ymax: float=0.75, imax: float=0.75, qmax: float=0.75):
@@ -9,8 +9,10 @@ import itertools as itr
 from collections.abc import Iterator, Sequence
 
 import more_itertools as mit
+import numpy as np
 
 from serpent.fun import str_join
+from serpent.padding import pad_end
 from serpent.visual import ansi
 
 COLOUR_MODES = ['RGB', 'P']
@@ -20,28 +22,44 @@ HALF_BLOCK = '\u2580'
 def pixels_to_blocks(
 	pixels: Sequence, width: int, *, mode: str='RGB', repeat=1
 ) -> Iterator[str]:
-	"""Convert a sequence of RGB pixels to Unicode block element graphics."""
+	"""Convert a sequence of RGB pixels to Unicode block element graphics.
+
+	Each line shows two rows of pixels as foreground (top) and background
+	(bottom) colours. The escape codes are formatted only once for each
+	distinct pair of colours.
+	"""
+	channels = 3 if mode in COLOUR_MODES else 1
 	if mode == 'RGB':
-		rgb = mit.grouper(pixels, 3, incomplete='fill', fillvalue=0)
+		colours = pad_end(np.asarray(pixels), 0, n=3).reshape(-1, 3)
 	else:
-		rgb = pixels
-	lines = mit.chunked(rgb, width * 2)  # double the line width
-	zero_pixel = (0, 0, 0) if mode in COLOUR_MODES else 0
-
-	for line in lines:
-		top_and_bottom = mit.chunked(line, width)  # split in half
-		columns = itr.zip_longest(*top_and_bottom, fillvalue=zero_pixel)
-
-		blocks = ''
-		for column in columns:
-			# FIXME Fixes the last line problem, that is caused by zero pixel
-			# bg colours getting filtered out, probably because of the spread
-			# operators
-			values = (column[0], zero_pixel) if len(column) == 1 else column
-			colours = ansi.rgb(*values) if mode in COLOUR_MODES else ansi.grey(*values)
-			blocks += colours + HALF_BLOCK * repeat
-
-		yield blocks + ansi.RESET
+		colours = np.asarray(pixels).reshape(-1, channels)
+
+	# Pad with zero pixels into lines of top and bottom rows
+	count = len(colours)
+	lines = -(-count // (2 * width))
+	cells = np.zeros((lines * 2 * width, channels), dtype=np.int64)
+	cells[:count] = colours
+	cells = cells.reshape(lines, 2, width, channels).transpose(0, 2, 1, 3)
+	cells = cells.reshape(lines, width, 2 * channels)
+
+	# Pack the colour pairs into integer keys to find the distinct ones
+	keys = cells @ (256 ** np.arange(2 * channels, dtype=np.int64))
+	[_, first, inverse] = np.unique(keys, return_index=True, return_inverse=True)
+	inverse = inverse.reshape(lines, width)
+
+	colour = ansi.rgb if mode in COLOUR_MODES else ansi.grey
+	block = HALF_BLOCK * repeat
+	pairs = cells.reshape(-1, 2, channels)[first].tolist()
+	if channels == 1:
+		pairs = [[top, bottom] for [[top], [bottom]] in pairs]
+	strs = np.array(
+		[colour(top, bottom) + block for [top, bottom] in pairs], dtype=object
+	)
+
+	for line in range(lines):
+		# Last line may have only a partial top row
+		columns = min(width, count - line * 2 * width)
+		yield str_join(strs[inverse[line, :columns]]) + ansi.RESET
 
 
 def pixels_to_verbose_blocks(